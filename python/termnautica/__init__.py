@@ -1,136 +1,188 @@
 import os
+import sys
 import random
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 
-import pygame
-import keyboard
-from charz import Engine, Camera, Screen, AssetLoader, Vec2
+from charz import AssetLoader
+
+from . import startup  # First, so startup is timed from here
 
 AssetLoader.animation_root = "assets/animations"
 AssetLoader.texture_root = "assets/sprites"
 random.seed(3)  # DEV
 
-pygame.mixer.init()
-
-from rust import RustScreen
-from . import ocean
-from .player import Player
-from .buildings.lifepod import Lifepod
 
+__all__ = ["App", "DevCamera", "main", "bench"]
 
-# NOTE: Game time is calculated in frames (int),
-#       because delta time is unstable at the moment
 
+# Provide correct completion help, even though the game is loaded lazily
+if TYPE_CHECKING:
+    from .app import App, DevCamera
 
-class DevCamera(Camera):
-    def update(self, _delta: float) -> None:
-        if keyboard.is_pressed("a"):
-            self.position.x -= 1
-        if keyboard.is_pressed("d"):
-            self.position.x += 1
-        if keyboard.is_pressed("w"):
-            self.position.y -= 1
-        if keyboard.is_pressed("s"):
-            self.position.y += 1
 
+# NOTE: The game is imported on first access, so commands like `bundle` start fast
+def __getattr__(name: str) -> object:
+    if name in ("App", "DevCamera"):
+        from . import app
 
-# TODO: O2 1/2
-# TODO: LIFEPOD 1/3
-# TODO: CRAFTING - WATER 1/4
-# TODO: Fix Sound not triggering the first time
+        return getattr(app, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-class App(Engine):
-    fps = 16
-    screen = RustScreen(
-        auto_resize=True,
-        initial_clear=True,
+def main(argv: list[str] | None = None) -> int | None:
+    parser = argparse.ArgumentParser(prog="termnautica")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="report time spent on imports, assets and world generation, after exit",
     )
-
-    def __init__(self) -> None:
-        camera = (
-            Camera()
-            .with_mode(Camera.MODE_CENTERED | Camera.MODE_INCLUDE_SIZE)
-            .as_current()
+    parser.add_argument(
+        "--record",
+        type=Path,
+        metavar="FILE",
+        help="record input of every frame to file, for `termnautica replay`",
+    )
+    parser.add_argument(
+        "--cost-report",
+        type=Path,
+        metavar="FILE",
+        help="append update and render cost per node class to file (.csv or JSON lines)",
+    )
+    parser.add_argument(
+        "--cost-interval",
+        type=int,
+        default=160,
+        metavar="FRAMES",
+        help="frames between each summary in cost report (default: 160)",
+    )
+    parser.add_argument(
+        "--input",
+        choices=("terminal", "keyboard"),
+        default="terminal",
+        help="read keys from terminal (default), or from `keyboard` (needs root on Linux)",
+    )
+    parser.add_argument(
+        "--spectate",
+        metavar="ADDRESS",
+        help="let others watch with `termnautica watch ADDRESS` (HOST:PORT or socket path)",
+    )
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser(
+        "bundle",
+        help="pack textures and animations into one bundle file",
+    )
+    replay_parser = commands.add_parser(
+        "replay",
+        help="replay recorded input headless, and check that gameplay is unchanged",
+    )
+    replay_parser.add_argument("file", type=Path)
+    watch_parser = commands.add_parser(
+        "watch",
+        help="watch a session started with `--spectate`",
+    )
+    watch_parser.add_argument("address", help="HOST:PORT or socket path")
+    bench_parser = commands.add_parser(
+        "bench",
+        help="run simulation headless as fast as possible, and report throughput",
+    )
+    bench_parser.add_argument("--ticks", type=int, default=1000)
+    bench_parser.add_argument(
+        "--width",
+        type=int,
+        default=500,
+        help="world width (default: 500)",
+    )
+    bench_parser.add_argument(
+        "--density",
+        type=float,
+        default=1,
+        help="multiplier for spawner chances (default: 1)",
+    )
+    bench_parser.add_argument(
+        "--entities",
+        type=int,
+        default=0,
+        help="extra fish spread across the world (default: 0)",
+    )
+    bench_parser.add_argument(
+        "--render",
+        action="store_true",
+        help="also render every frame into memory",
+    )
+    bench_parser.add_argument(
+        "--per-class",
+        action="store_true",
+        help="also report update time per node class (slows the timed loop)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "bundle":
+        from . import assets
+
+        path = assets.build_bundle()
+        print(f"Wrote {path}")
+        return 0
+    if args.command == "watch":
+        from . import spectate
+
+        return spectate.watch(args.address)
+    if args.command == "bench":
+        from . import benchmark
+
+        return benchmark.run(
+            ticks=args.ticks,
+            width=args.width,
+            density=args.density,
+            entities=args.entities,
+            render=args.render,
+            per_class=args.per_class,
         )
-        self.player = Player()
-        # Attatch camera to player
-        camera.parent = self.player
-        # Attatch lifepod to waving water
-        ocean.generate_floor()
-        ocean.generate_water()
-        self.lifepod = Lifepod()
-        middle_ocean_water = ocean.Water().save_rest_location()
-        self.lifepod.parent = middle_ocean_water
-        # Music
-        pygame.mixer_music.load("assets/music/main.mp3")
-        pygame.mixer_music.set_volume(0.50)
-        pygame.mixer_music.play(-1)  # Infinite loop
-        # pygame.mixer.set_num_channels(64)
-        # DEV: Stuff stashed away in this method
-        self.dev()
-
-    def dev(self) -> None:
-        from .fish import SwordFish, Nemo
-        # from .birds import SmallBird, MediumBird, LargeBird
-
-        SwordFish(position=Vec2(80, -18))
-        Nemo(position=Vec2(-40, -20))
-
-        # for i in range(-10, 10):
-        #     if random.randint(1, 3) == 1:
-        #         continue
-        #     if random.randint(1, 8) == 1:
-        #         LargeBird().with_global_position(
-        #             x=random.randint(0, 5) + i * 15 - 50,
-        #             y=random.randint(0, 10) - 20,
-        #         )
-        #         continue
-        #     bird = random.choice([SmallBird, MediumBird])
-        #     bird().with_global_position(
-        #         x=random.randint(0, 5) + i * 15 - 50,
-        #         y=random.randint(0, 10) - 20,
-        #     )
-
-        from .buildings.grill import Grill
-
-        Grill(position=Vec2(10, 28))
-
-        # from .fish import WaterFish
-        # from .spawners import FishSpawner
-
-        # for i in range(0, 5):
-        #     f = WaterFish(position=Vec2(20, -10))
-        #     f.position.x += i * 10
-        #     f.position.y += random.randint(-2, 2)
-        #     f.speed_y = -20
-        # FishSpawner().with_global_position(x=20, y=-10)
-
-    def update(self, _delta: float) -> None:
-        ocean.Water.advance_wave_time()
-        if keyboard.is_pressed("esc"):
-            self.is_running = False
-            self.screen.clear()
-            pygame.quit()
-
-        self.dev_update()  # DEV
-
-    def dev_update(self) -> None:
-        from .buildings.hallway import Hallway
-        from .item import ItemID
-
-        if keyboard.is_pressed("b"):
-            if (
-                ItemID.TITANIUM_BAR in self.player.inventory
-                and self.player.inventory[ItemID.TITANIUM_BAR] >= 3
-            ):
-                self.player.inventory[ItemID.TITANIUM_BAR] -= 3
-                Hallway().with_global_position(
-                    self.player.global_position + Vec2.RIGHT * 5
-                )
-
-
-def main() -> int | None:
+
+    if args.cost_report is not None:
+        from .costs import CostAccounting
+
+        CostAccounting.enable(args.cost_report, args.cost_interval)
+
+    if args.command == "replay":
+        from . import replay
+
+        try:
+            return replay.replay(args.file)
+        finally:
+            if args.cost_report is not None:
+                CostAccounting.export()
+
+    with startup.measure("import"):
+        from .app import App
+        from .replay import Recording
+        from . import controls
     app = App()
-    app.run()
+    if args.record is not None:
+        app.recording = Recording()
+    if args.spectate is not None:
+        from .spectate import SpectatorServer
+
+        app.screen.spectators = SpectatorServer(args.spectate)
+        app.screen.spectators.start()
+    controls.start(args.input)
+    try:
+        app.run()
+    finally:
+        controls.stop()
+        if app.screen.spectators is not None:
+            app.screen.spectators.stop()
+        if args.cost_report is not None:
+            CostAccounting.export()
+    if app.recording is not None:
+        app.recording.save(args.record)
+    if args.profile_startup:
+        print(startup.report(), file=sys.stderr)
+
+
+def bench() -> int | None:
+    # Same as `termnautica bench`
+    return main(["bench", *sys.argv[1:]])
@@ -0,0 +1,105 @@
+"""Animations driven by one shared clock, instead of by each node.
+
+Frames are precomputed once per class, and per variant (like a mirrored version).
+Each instance only stores which animation it plays, its variant,
+and the `GameTime.frame` it started on, since the frame to show follows from the clock.
+Textures are only written for instances inside the viewport,
+so animations off screen cost nothing, and show the right frame once they are seen.
+"""
+
+from typing import Any, ClassVar, Self
+
+from charz import Animation, Vec2
+
+from .gametime import GameTime
+from .spatial import SpatialHash
+from .utils import flipped_h
+
+
+type Frames = tuple[list[str], ...]
+
+
+def with_mirrored(animation: Animation) -> tuple[Frames, Frames]:
+    """Create variants of animation, where variant 1 is mirrored horizontally
+
+    Args:
+        animation (Animation): animation to create variants of
+
+    Returns:
+        tuple[Frames, Frames]: original frames and mirrored frames
+    """
+    frames = tuple(animation.frames)
+    return (frames, tuple(map(flipped_h, frames)))
+
+
+class ClockAnimated:  # Component (mixin class)
+    _VIEWPORT_MARGIN: ClassVar[int] = 8  # Extra cells, for textures reaching into view
+    visibility: ClassVar[SpatialHash[Any]] = SpatialHash(cell_size=32)
+    # Variants of each animation, by animation name
+    frame_sets: ClassVar[dict[str, tuple[Frames, ...]]] = {}
+    animation: str = ""  # Current animation, in `frame_sets`
+    variant: int = 0
+    repeat: bool = False
+    texture: list[str]
+    _start_frame: int = 0
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        instance = super().__new__(cls, *args, **kwargs)
+        instance._start_frame = GameTime.frame
+        ClockAnimated.visibility.insert(instance)
+        return instance
+
+    def play(self, animation: str, /) -> None:
+        assert animation in self.frame_sets, f"Animation not found: {animation!r}"
+        self.animation = animation
+        self._start_frame = GameTime.frame
+        self.texture = self.get_frames()[0]
+
+    def set_phase(self, phase: int, /) -> None:
+        # Offset of current animation, in frames
+        self._start_frame = GameTime.frame - phase
+
+    def get_frames(self) -> Frames:
+        variants = self.frame_sets[self.animation]
+        return variants[self.variant % len(variants)]
+
+    def get_frame_index(self) -> int:
+        frame_count = len(self.get_frames())
+        elapsed = GameTime.frame - self._start_frame
+        if self.repeat:
+            return elapsed % frame_count
+        return min(elapsed, frame_count - 1)
+
+    def is_finished(self) -> bool:
+        if self.repeat:
+            return False
+        return GameTime.frame - self._start_frame >= len(self.get_frames())
+
+    # NOTE: Call after moving, so `ClockAnimated.visibility` stays up to date
+    def update_visibility(self) -> None:
+        ClockAnimated.visibility.move(self)  # type: ignore
+
+    @classmethod
+    def advance_visible(cls, center: Vec2, size: Vec2) -> None:  # Call from `App.update`
+        """Write the current frame of every animation inside the viewport
+
+        Args:
+            center (Vec2): global center of viewport
+            size (Vec2): size of viewport
+        """
+        half_width = size.x / 2 + cls._VIEWPORT_MARGIN
+        half_height = size.y / 2 + cls._VIEWPORT_MARGIN
+        for node in ClockAnimated.visibility.query(
+            center,
+            max(half_width, half_height),
+        ):
+            position = node.global_position
+            if (
+                abs(position.x - center.x) <= half_width
+                and abs(position.y - center.y) <= half_height
+            ):
+                node.texture = node.get_frames()[node.get_frame_index()]
+
+    def _free(self) -> None:
+        ClockAnimated.visibility.remove(self)  # type: ignore
+        super()._free()  # type: ignore
@@ -0,0 +1,187 @@
+import time
+
+from charz import Engine, Camera, Node, Vec2
+
+from . import ui, ocean, audio, startup, controls
+from .screen import GameScreen
+from .profiler import FrameProfiler
+from .costs import CostAccounting
+from .ticks import TickScheduler
+from .gametime import GameTime
+from .replay import Recording
+from .animation import ClockAnimated
+from .player import Player
+from .buildings.lifepod import Lifepod
+from .transforms import CachedTransform
+
+
+# NOTE: Game time is calculated in frames (int),
+#       because delta time is unstable at the moment
+
+
+class PlayerCamera(CachedTransform, Camera): ...  # Parent of UI
+
+
+class DevCamera(Camera):
+    def update(self, _delta: float) -> None:
+        if controls.is_pressed("a"):
+            self.position.x -= 1
+        if controls.is_pressed("d"):
+            self.position.x += 1
+        if controls.is_pressed("w"):
+            self.position.y -= 1
+        if controls.is_pressed("s"):
+            self.position.y += 1
+
+
+# TODO: O2 1/2
+# TODO: LIFEPOD 1/3
+# TODO: CRAFTING - WATER 1/4
+# TODO: Fix Sound not triggering the first time
+
+
+class App(Engine):
+    fps = 16
+    screen = GameScreen(
+        auto_resize=True,
+        initial_clear=True,
+    )
+    is_headless: bool = False  # Without sound, and driven by `App.tick`
+    recording: Recording | None = None  # Captures input of every frame when set
+    worldgen_workers: int | None = None  # Processes for floor, `None` is one per core
+
+    def __init__(self) -> None:
+        # NOTE: Game runs without sound if there is no audio device
+        if not self.is_headless:
+            with startup.measure("audio"):
+                audio.init()
+        camera = (
+            PlayerCamera()
+            .with_mode(Camera.MODE_CENTERED | Camera.MODE_INCLUDE_SIZE)
+            .as_current()
+        )
+        self.player = Player()
+        # Attatch camera to player
+        camera.parent = self.player
+        ui.FrameStats(camera)
+        # Attatch lifepod to waving water
+        with startup.measure("world"):
+            ocean.generate_floor(self.worldgen_workers)
+            ocean.generate_water()
+            self.lifepod = Lifepod()
+            middle_ocean_water = ocean.Water().save_rest_location()
+            self.lifepod.parent = middle_ocean_water
+        # Music
+        audio.play_music("assets/music/main.mp3", volume=0.50)
+        # DEV: Stuff stashed away in this method
+        self.dev()
+        # Decode sounds while the first frames are shown
+        audio.prefetch()
+        startup.mark_first_frame(self.screen)
+
+    def dev(self) -> None:
+        from .fish import SwordFish, Nemo
+        # from .birds import SmallBird, MediumBird, LargeBird
+
+        SwordFish(position=Vec2(80, -18))
+        Nemo(position=Vec2(-40, -20))
+
+        # for i in range(-10, 10):
+        #     if random.randint(1, 3) == 1:
+        #         continue
+        #     if random.randint(1, 8) == 1:
+        #         LargeBird().with_global_position(
+        #             x=random.randint(0, 5) + i * 15 - 50,
+        #             y=random.randint(0, 10) - 20,
+        #         )
+        #         continue
+        #     bird = random.choice([SmallBird, MediumBird])
+        #     bird().with_global_position(
+        #         x=random.randint(0, 5) + i * 15 - 50,
+        #         y=random.randint(0, 10) - 20,
+        #     )
+
+        from .buildings.grill import Grill
+
+        Grill(position=Vec2(10, 28))
+
+        # from .fish import WaterFish
+        # from .spawners import FishSpawner
+
+        # for i in range(0, 5):
+        #     f = WaterFish(position=Vec2(20, -10))
+        #     f.position.x += i * 10
+        #     f.position.y += random.randint(-2, 2)
+        #     f.speed_y = -20
+        # FishSpawner().with_global_position(x=20, y=-10)
+
+    def run(self) -> None:
+        # Same as `Engine.run`, with each frame processed by `App.tick`
+        self.screen.on_startup()
+        self.is_running = True
+        while self.is_running:
+            self.tick()
+            self.screen.refresh()
+            self.clock.tick()
+        self.screen.on_cleanup()
+
+    def tick(self) -> None:
+        # One frame of `Engine.run`, without rendering and waiting
+        delta = self.clock.delta
+        if CostAccounting.is_enabled:
+            start = time.perf_counter()
+            self.update(delta)
+            CostAccounting.add_update_time(
+                self.__class__.__name__,
+                time.perf_counter() - start,
+            )
+        else:
+            self.update(delta)
+        for queued_node in Node._queued_nodes:
+            queued_node._free()
+        Node._queued_nodes *= 0
+        if CostAccounting.is_enabled:
+            CostAccounting.update_nodes(delta)
+            CostAccounting.count_cells(self.screen)
+            CostAccounting.end_frame()
+        else:
+            TickScheduler.update_nodes(delta)
+
+    def update(self, _delta: float) -> None:
+        FrameProfiler.begin_frame()
+        snapshot = controls.poll()
+        if self.recording is not None:
+            self.recording.capture(self, snapshot.mask)
+        if snapshot.is_just_pressed("f3"):
+            FrameProfiler.toggle()
+        GameTime.advance()
+        ocean.Water.advance_wave_time()
+        viewport_center = Camera.current.global_position
+        viewport_size = self.screen.get_actual_size()
+        ClockAnimated.advance_visible(viewport_center, viewport_size)
+        audio.set_listener(viewport_center, viewport_size)
+        if controls.is_pressed("esc"):
+            self.is_running = False
+            self.screen.clear()
+            audio.shutdown()
+
+        self.dev_update()  # DEV
+
+    def dev_update(self) -> None:
+        from .buildings.hallway import Hallway
+        from .item import ItemID
+
+        if controls.is_pressed("b"):
+            if self.player.inventory.get_count(ItemID.TITANIUM_BAR) >= 3:
+                self.player.inventory.remove(ItemID.TITANIUM_BAR, 3)
+                Hallway().with_global_position(
+                    self.player.global_position + Vec2.RIGHT * 5
+                )
+
+
+class HeadlessApp(App):
+    is_headless = True
+
+
+class SessionApp(HeadlessApp):  # One of many, see `world.run_sessions`
+    worldgen_workers = 1  # Sessions already run in parallel
@@ -0,0 +1,266 @@
+"""Textures and animations, served from one packed bundle file.
+
+`build_bundle` packs every texture under `AssetLoader.texture_root`, and every
+animation frame under `AssetLoader.animation_root`, into one indexed file.
+The bundle is memory-mapped on first use, and each texture is decoded once
+into an in-process cache, so loading a texture during gameplay does no file I/O.
+
+Without a bundle, assets are read from their own files instead, into the same cache.
+The bundle stores the newest modification time of the asset files it was built from,
+and is ignored (with a warning) if any asset file or folder has changed since.
+Rebuild the bundle with `termnautica bundle` after changing any asset.
+
+Layout of bundle:
+    magic (4 bytes) | index length (u32, little endian) | index (JSON) | data
+where the index maps texture paths to `[offset, length]` into data,
+animation folders to a list of such pairs, one per frame in order,
+and `"source_mtime_ns"` to the newest modification time of the sources.
+"""
+
+import json
+import mmap
+import os
+import sys
+import struct
+from pathlib import Path
+from typing import Any
+
+from charz import Animation, AssetLoader, text
+
+from . import startup
+
+
+type Span = tuple[int, int]  # Offset and length, into data section
+
+
+BUNDLE_PATH: Path = Path("assets/bundle.pak")
+_MAGIC: bytes = b"TNP1"
+_HEADER = struct.Struct("<4sI")
+
+_textures: dict[str, tuple[str, ...]] = {}  # Decoded cache, by texture path
+_animation_frames: dict[str, tuple[tuple[str, ...], ...]] = {}
+_bundle: "_Bundle | None" = None
+_is_bundle_checked: bool = False
+
+
+class _Bundle:
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load_index(path)
+        except BaseException:
+            self._mmap.close()
+            raise
+
+    def _load_index(self, path: Path) -> None:
+        (magic, index_length) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Invalid bundle file: {path}")
+        index_start = _HEADER.size
+        if index_start + index_length > len(self._mmap):
+            raise ValueError(f"Truncated bundle file: {path}")
+        # NOTE: `json.JSONDecodeError` is a `ValueError`
+        index: dict[str, Any] = json.loads(
+            self._mmap[index_start : index_start + index_length]
+        )
+        if not isinstance(index, dict):
+            raise ValueError(f"Invalid bundle index: {path}")
+        self._data_start = index_start + index_length
+        self.source_mtime_ns: int = index.get("source_mtime_ns", 0)  # 0 if unknown
+        self.textures: dict[str, Span] = {
+            name: (offset, length) for name, (offset, length) in index["textures"].items()
+        }
+        self.animations: dict[str, list[Span]] = {
+            name: [(offset, length) for offset, length in spans]
+            for name, spans in index["animations"].items()
+        }
+        # Spans reaching past the end would read cut off assets
+        data_length = len(self._mmap) - self._data_start
+        for offset, length in (
+            *self.textures.values(),
+            *(span for spans in self.animations.values() for span in spans),
+        ):
+            if offset + length > data_length:
+                raise ValueError(f"Truncated bundle file: {path}")
+
+    def read(self, span: Span) -> str:
+        (offset, length) = span
+        start = self._data_start + offset
+        return self._mmap[start : start + length].decode("utf-8")
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def _newest_source_mtime_ns() -> int:
+    # Folders are included, so removed and added files count as changes
+    newest = 0
+    for root in (Path(AssetLoader.texture_root), Path(AssetLoader.animation_root)):
+        if not root.is_dir():
+            continue
+        newest = max(newest, root.stat().st_mtime_ns)
+        for entry in root.rglob("*"):
+            newest = max(newest, entry.stat().st_mtime_ns)
+    return newest
+
+
+def _get_bundle() -> _Bundle | None:
+    global _bundle, _is_bundle_checked
+    if not _is_bundle_checked:
+        _is_bundle_checked = True
+        if not BUNDLE_PATH.is_file():
+            return None
+        # Bundle is only a cache, so a broken one is skipped, like an outdated one
+        try:
+            bundle = _Bundle(BUNDLE_PATH)
+        except (OSError, ValueError, KeyError, TypeError, struct.error) as error:
+            print(
+                f"Ignoring unreadable {BUNDLE_PATH} ({error})"
+                " - Rebuild it with `termnautica bundle`",
+                file=sys.stderr,
+            )
+        else:
+            if bundle.source_mtime_ns < _newest_source_mtime_ns():
+                bundle.close()
+                print(
+                    f"Ignoring outdated {BUNDLE_PATH}, since assets changed after it"
+                    " was built - Rebuild it with `termnautica bundle`",
+                    file=sys.stderr,
+                )
+            else:
+                _bundle = bundle
+    return _bundle
+
+
+def _frame_sort_key(file: Path) -> tuple[bool, int, str]:
+    # Numbered frames in numeric order, so "10.txt" comes after "9.txt"
+    is_numbered = file.stem.isdigit()
+    return (not is_numbered, int(file.stem) if is_numbered else 0, file.name)
+
+
+def _frame_files(folder: Path) -> list[Path]:
+    return sorted(
+        (file for file in folder.iterdir() if file.is_file()),
+        key=_frame_sort_key,
+    )
+
+
+def _decode(content: str) -> tuple[str, ...]:
+    # Same as `charz.load_texture` with default arguments
+    return tuple(text.fill_lines(content.splitlines()))
+
+
+def load_texture(texture_path: str, /) -> list[str]:
+    """Load texture, relative to `AssetLoader.texture_root`
+
+    Args:
+        texture_path (str): path to texture file, like `"lifepod/front.txt"`
+
+    Returns:
+        list[str]: new list with the texture lines, safe to mutate
+    """
+    if texture_path not in _textures:
+        with startup.measure("assets"):
+            bundle = _get_bundle()
+            if bundle is not None and texture_path in bundle.textures:
+                content = bundle.read(bundle.textures[texture_path])
+            else:
+                file = Path(AssetLoader.texture_root).joinpath(texture_path)
+                content = file.read_text(encoding="utf-8")
+            _textures[texture_path] = _decode(content)
+    return list(_textures[texture_path])
+
+
+def load_animation(animation_path: str, /) -> Animation:
+    """Load animation, relative to `AssetLoader.animation_root`
+
+    Frames are ordered by number, when named like `"1.txt"`.
+
+    Args:
+        animation_path (str): path to folder with frames, like `"bubble/float"`
+
+    Returns:
+        Animation: new animation
+    """
+    if animation_path not in _animation_frames:
+        with startup.measure("assets"):
+            bundle = _get_bundle()
+            if bundle is not None and animation_path in bundle.animations:
+                contents = [
+                    bundle.read(span) for span in bundle.animations[animation_path]
+                ]
+            else:
+                folder = Path(AssetLoader.animation_root).joinpath(animation_path)
+                contents = [
+                    file.read_text(encoding="utf-8") for file in _frame_files(folder)
+                ]
+            _animation_frames[animation_path] = tuple(map(_decode, contents))
+    return Animation.from_frames(
+        [list(frame) for frame in _animation_frames[animation_path]],
+        fill=False,  # Already filled when decoded
+        unique=False,  # Fresh lists
+    )
+
+
+def build_bundle(path: Path = BUNDLE_PATH) -> Path:
+    """Pack every texture and animation frame into one bundle file
+
+    Args:
+        path (Path, optional): where to write bundle. Defaults to BUNDLE_PATH.
+
+    Returns:
+        Path: path of written bundle
+    """
+    global _bundle, _is_bundle_checked
+    data = bytearray()
+    # Before reading, so assets changed while packing make the bundle outdated
+    source_mtime_ns = _newest_source_mtime_ns()
+
+    def append(file: Path) -> Span:
+        content = file.read_bytes()
+        span = (len(data), len(content))
+        data.extend(content)
+        return span
+
+    texture_root = Path(AssetLoader.texture_root)
+    textures = {
+        file.relative_to(texture_root).as_posix(): append(file)
+        for file in sorted(texture_root.rglob("*"))
+        if file.is_file()
+    }
+    animation_root = Path(AssetLoader.animation_root)
+    animations = {
+        folder.relative_to(animation_root).as_posix(): [
+            append(file) for file in _frame_files(folder)
+        ]
+        for folder in sorted(animation_root.rglob("*"))
+        if folder.is_dir() and any(file.is_file() for file in folder.iterdir())
+    }
+    index = json.dumps(
+        {
+            "textures": textures,
+            "animations": animations,
+            "source_mtime_ns": source_mtime_ns,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    # Release current bundle, so it can be replaced
+    if _bundle is not None:
+        _bundle.close()
+        _bundle = None
+    _is_bundle_checked = False
+    # Written next to it, and moved into place once complete,
+    # so an interrupted build never leaves a half written bundle behind
+    temporary_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with temporary_path.open("wb") as file:
+            file.write(_HEADER.pack(_MAGIC, len(index)))
+            file.write(index)
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+    return path
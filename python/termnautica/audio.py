@@ -0,0 +1,260 @@
+"""Sound registry, that loads sound files lazily, and plays them on a fixed set of voices.
+
+Sounds are declared at import time as `LazySound` handles, without touching the mixer.
+The decoded buffer is loaded on first play, or ahead of time by `prefetch`,
+which runs on a background thread after startup.
+Handles made from the same file share one decoded buffer.
+
+Every sound is played through `play`, which owns the mixer channels (voices).
+When all voices are busy, the oldest voice with lower priority is stolen,
+or the new sound is dropped. Sounds with a position are attenuated by
+their distance to the listener (the camera), and dropped without being decoded
+if their source is outside the viewport.
+
+If the mixer can't be initialized (like when there is no audio device),
+every handle turns into a no-op, so the game runs silently.
+"""
+
+import threading
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from charz import Vec2
+
+from .gametime import GameTime
+from .lazy import lazy_import
+
+if TYPE_CHECKING:
+    import pygame
+else:
+    pygame = lazy_import("pygame")  # Heavy, so imported when the mixer starts
+
+
+_sounds: dict[str, "pygame.mixer.Sound | None"] = {}  # Decoded buffers, by path
+_handles: dict[str, "LazySound"] = {}  # One shared handle per path
+_lock = threading.Lock()
+_is_enabled: bool = False
+
+VOICE_COUNT: int = 8
+_MIN_VOLUME: float = 0.25  # At the edge of the listener viewport
+_LISTENER_MARGIN: int = 8  # Cells outside the viewport that can still be heard
+_listener_center: Vec2 = Vec2.ZERO
+_listener_half_size: Vec2 = Vec2(1, 1)
+
+
+class Priority(IntEnum):
+    AMBIENT = 0
+    EFFECT = 1
+    UI = 2
+
+
+class _Voice:
+    __slots__ = ("channel", "sound", "priority", "start_frame")
+
+    def __init__(self, channel: "pygame.mixer.Channel") -> None:
+        self.channel = channel
+        self.sound: LazySound | None = None  # Last sound played
+        self.priority = Priority.AMBIENT
+        self.start_frame = 0
+
+    def is_playing(self, sound: "LazySound | None" = None) -> bool:
+        if not self.channel.get_busy():
+            return False
+        return sound is None or self.sound is sound
+
+
+_voices: list[_Voice] = []
+
+
+class LazySound:
+    __slots__ = ("path", "prefetch")
+
+    def __init__(self, path: str, prefetch: bool) -> None:
+        self.path = path
+        self.prefetch = prefetch  # Whether to decode it on the prefetch thread
+
+    def resolve(self) -> "pygame.mixer.Sound | None":
+        # Returns `None` if audio is disabled, or the file could not be decoded
+        if self.path in _sounds:  # Fast path, without locking
+            return _sounds[self.path]
+        if not _is_enabled:
+            return None
+        with _lock:
+            if self.path not in _sounds:
+                try:
+                    _sounds[self.path] = pygame.mixer.Sound(self.path)
+                except pygame.error:
+                    _sounds[self.path] = None
+            return _sounds[self.path]
+
+    def play(
+        self,
+        *,
+        priority: Priority = Priority.EFFECT,
+        position: Vec2 | None = None,
+        exclusive: bool = False,
+    ) -> bool:
+        return play(self, priority=priority, position=position, exclusive=exclusive)
+
+
+def load(path: str, *, prefetch: bool = True) -> LazySound:
+    """Declare sound, without loading it
+
+    Args:
+        path (str): path to sound file
+        prefetch (bool, optional): load on the prefetch thread,
+            instead of on first play. Defaults to True.
+
+    Returns:
+        LazySound: handle, shared with other calls using the same path
+    """
+    if path in _handles:
+        handle = _handles[path]
+        handle.prefetch = handle.prefetch or prefetch
+        return handle
+    handle = LazySound(path, prefetch)
+    _handles[path] = handle
+    return handle
+
+
+def init() -> bool:
+    """Initialize the mixer, if there is audio available
+
+    Returns:
+        bool: whether audio is enabled
+    """
+    global _is_enabled
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        _is_enabled = False
+    else:
+        _is_enabled = True
+        pygame.mixer.set_num_channels(VOICE_COUNT)
+        _voices[:] = [_Voice(pygame.mixer.Channel(index)) for index in range(VOICE_COUNT)]
+    return _is_enabled
+
+
+def is_enabled() -> bool:
+    return _is_enabled
+
+
+def set_listener(center: Vec2, size: Vec2) -> None:  # Call from `App.update`
+    global _listener_center, _listener_half_size
+    _listener_center = center.copy()
+    _listener_half_size = Vec2(
+        max(1, size.x / 2 + _LISTENER_MARGIN),
+        max(1, size.y / 2 + _LISTENER_MARGIN),
+    )
+
+
+def volume_at(position: Vec2) -> float:
+    """Get volume of a sound source, relative to the listener
+
+    Args:
+        position (Vec2): global position of sound source
+
+    Returns:
+        float: volume in range `[_MIN_VOLUME, 1]`, or `0` if it can't be heard
+    """
+    # Normalized so the edge of the listener viewport is at distance 1
+    distance = max(
+        abs(position.x - _listener_center.x) / _listener_half_size.x,
+        abs(position.y - _listener_center.y) / _listener_half_size.y,
+    )
+    if distance > 1:
+        return 0
+    return 1 - (1 - _MIN_VOLUME) * distance
+
+
+def play(
+    sound: LazySound,
+    *,
+    priority: Priority = Priority.EFFECT,
+    position: Vec2 | None = None,
+    exclusive: bool = False,
+) -> bool:
+    """Play sound on a free voice, or steal a voice with lower priority
+
+    Args:
+        sound (LazySound): sound to play
+        priority (Priority, optional): used when every voice is busy.
+            Defaults to Priority.EFFECT.
+        position (Vec2 | None, optional): global position of source,
+            for distance attenuation. When `None`, sound is played at full volume.
+            Defaults to None.
+        exclusive (bool, optional): do not play if sound is already playing.
+            Defaults to False.
+
+    Returns:
+        bool: whether sound was played
+    """
+    if not _is_enabled:
+        return False
+    volume = 1.0
+    if position is not None:
+        volume = volume_at(position)
+        if volume == 0:  # Culled before decoding
+            return False
+    if exclusive and any(voice.is_playing(sound) for voice in _voices):
+        return False
+    resolved = sound.resolve()
+    if resolved is None:
+        return False
+    voice = _claim_voice(priority)
+    if voice is None:
+        return False
+    voice.sound = sound
+    voice.priority = priority
+    voice.start_frame = GameTime.frame
+    voice.channel.set_volume(volume)
+    voice.channel.play(resolved)
+    return True
+
+
+def _claim_voice(priority: Priority) -> _Voice | None:
+    stealable: _Voice | None = None
+    for voice in _voices:
+        if not voice.is_playing():
+            return voice
+        if voice.priority <= priority and (
+            stealable is None
+            or (voice.priority, voice.start_frame)
+            < (stealable.priority, stealable.start_frame)
+        ):
+            stealable = voice
+    if stealable is not None:
+        stealable.channel.stop()
+    return stealable
+
+
+def prefetch() -> threading.Thread:
+    """Decode sounds marked for prefetching, on a background thread
+
+    Returns:
+        threading.Thread: the started daemon thread
+    """
+    handles = [handle for handle in _handles.values() if handle.prefetch]
+
+    def worker() -> None:
+        for handle in handles:
+            handle.resolve()
+
+    thread = threading.Thread(target=worker, name="sound-prefetch", daemon=True)
+    thread.start()
+    return thread
+
+
+def play_music(path: str, *, volume: float) -> None:
+    if not _is_enabled:
+        return
+    pygame.mixer_music.load(path)
+    pygame.mixer_music.set_volume(volume)
+    pygame.mixer_music.play(-1)  # Infinite loop
+
+
+def shutdown() -> None:
+    global _is_enabled
+    _is_enabled = False
+    _voices.clear()
+    pygame.quit()
@@ -0,0 +1,119 @@
+"""Headless simulation benchmark, run with `termnautica bench`.
+
+Builds the world with sound off and no input, then runs a number of ticks
+as fast as possible, optionally rendering each frame into memory.
+World width, spawner density and extra fish are configurable,
+to measure how the game scales with world size.
+
+Throughput is measured without cost accounting, since timing every node update
+slows the loop down. With `--per-class`, time per node class is also reported,
+and throughput is then of the timed loop.
+"""
+
+import io
+import random
+import sys
+import time
+
+from charz import clamp
+
+from . import ocean, controls, startup
+from .costs import CostAccounting
+
+
+_TOP_CLASSES: int = 10  # Node classes shown in report, by total update time
+
+
+def peak_rss_kib() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":  # Reported in bytes, instead of KiB
+        peak //= 1024
+    return peak
+
+
+def run(
+    *,
+    ticks: int,
+    width: int,
+    density: float,
+    entities: int,
+    render: bool,
+    per_class: bool = False,
+) -> int:
+    """Build the world and run ticks, then print a report
+
+    Args:
+        ticks (int): ticks to run
+        width (int): world width, see `ocean.WIDTH`
+        density (float): multiplier for every chance in `ocean.SPAWN_CHANCES`
+        entities (int): extra fish, spread across the world
+        render (bool): render every frame into memory, which needs `rust.render`
+        per_class (bool, optional): also report time per node class.
+            Defaults to False.
+
+    Returns:
+        int: exit code
+    """
+    ocean.WIDTH = width
+    for spawner, chance in ocean.SPAWN_CHANCES.items():
+        ocean.SPAWN_CHANCES[spawner] = int(clamp(round(chance * density), 0, 100))
+    controls.set_source(lambda: 0)  # Nothing pressed
+    if per_class:
+        CostAccounting.enable(None)
+        CostAccounting.is_counting_cells = False
+
+    from .app import HeadlessApp
+    from .fish import SmallFish, MediumFish, LongFish, WaterFish
+
+    with startup.measure("build"):
+        app = HeadlessApp()
+        for _ in range(entities):
+            kind = random.choice((SmallFish, MediumFish, LongFish, WaterFish))
+            kind().with_global_position(
+                x=random.randint(-width // 2, width // 2 - 1),
+                y=random.randint(5, 25),
+            )
+    if render:
+        app.screen.stream = io.StringIO()
+    app.is_running = True
+
+    render_time = 0.0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        app.tick()
+        if render:
+            render_start = time.perf_counter()
+            app.screen.refresh()
+            render_time += time.perf_counter() - render_start
+            app.screen.stream.seek(0)
+            app.screen.stream.truncate()
+    elapsed = time.perf_counter() - start
+
+    peak = peak_rss_kib()
+    print(f"Ticks:       {ticks} ({width} wide, density {density}, +{entities} fish)")
+    timed = " (timed per class)" if per_class else ""
+    print(
+        f"Throughput:  {ticks / max(elapsed, 1e-9):.1f} ticks/s ({elapsed:.2f}s){timed}"
+    )
+    print(f"Peak RSS:    {'n/a' if peak is None else f'{peak / 1024:.1f} MiB'}")
+    print(startup.report())
+    if not (render or per_class):
+        return 0
+    rows = sorted(
+        CostAccounting.summary() if per_class else [],
+        key=lambda row: row["update_ms_total"],
+        reverse=True,
+    )
+    print("Time per subsystem:")
+    if render:
+        print(f"  {'render':<20}{render_time * 1000:>10.1f} ms")
+    for row in rows[:_TOP_CLASSES]:
+        print(
+            f"  {row['class']:<20}{row['update_ms_total']:>10.1f} ms"
+            f"  ({row['calls']} calls)"
+        )
+    return 0
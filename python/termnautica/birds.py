@@ -1,8 +1,10 @@
 import random
 
 import colex
-from charz import AnimatedSprite, AnimationSet, Animation, Vec2, text
+from charz import Sprite, Vec2, text
 
+from .animation import ClockAnimated, with_mirrored
+from .assets import load_animation
 from .props import Interactable, Collectable
 from . import ocean
 
@@ -16,7 +18,7 @@ class BirdAI:
     _SPEED_SCALE: float = 0.3
 
     def update(self, _delta: float) -> None:
-        assert isinstance(self, AnimatedSprite)
+        assert isinstance(self, ClockAnimated) and isinstance(self, Sprite)
 
         velocity = Vec2(
             random.randint(-1, 1),
@@ -27,42 +29,40 @@ class BirdAI:
             self.global_position.x
         ):
             self.global_position += Vec2.UP
+        if isinstance(self, Interactable):
+            self.update_spatial_hash()
+        self.update_visibility()
 
         if random.randint(1, 100) < 30:
-            self.texture = text.flip_lines_h(self.texture)
+            self.variant ^= 1  # Mirrored flap for variant 1
 
 
-class BaseBird(BirdAI, Interactable, Collectable, AnimatedSprite):
+class BaseBird(BirdAI, Interactable, Collectable, ClockAnimated, Sprite):
     transparency = "."
     centered = True
+    animation = "Flap"
     repeat = True
-    is_playing = True
 
 
 class SmallBird(BaseBird):
-    animations = AnimationSet(
-        Flap=Animation("birds/small/flap"),
-    )
+    frame_sets = {
+        "Flap": with_mirrored(load_animation("birds/small/flap")),
+    }
     color = colex.SADDLE_BROWN
-    current_animation = animations.Flap
-    texture = current_animation.frames[0]
+    texture = frame_sets["Flap"][0][0]
 
 
 class MediumBird(BaseBird):
-    animations = AnimationSet(
-        Flap=Animation("birds/medium/flap"),
-    )
+    frame_sets = {
+        "Flap": with_mirrored(load_animation("birds/medium/flap")),
+    }
     color = colex.LIGHT_GRAY
-    texture = ["V"]
-    current_animation = animations.Flap
-    texture = current_animation.frames[0]
+    texture = frame_sets["Flap"][0][0]
 
 
 class LargeBird(BaseBird):
-    animations = AnimationSet(
-        Flap=Animation("birds/large/flap"),
-    )
+    frame_sets = {
+        "Flap": with_mirrored(load_animation("birds/large/flap")),
+    }
     color = colex.BURLY_WOOD
-    texture = ["V"]
-    current_animation = animations.Flap
-    texture = current_animation.frames[0]
+    texture = frame_sets["Flap"][0][0]
@@ -1,11 +1,13 @@
 import colex
-from charz import Sprite, Collider, Hitbox, Vec2, load_texture
+from charz import Sprite, Hitbox, Vec2
 
+from ..assets import load_texture
 from ..player import Player
 from ..props import Interactable
+from ..collision import BroadphaseCollider
 
 
-class Airlock(Interactable, Collider, Sprite):
+class Airlock(Interactable, BroadphaseCollider, Sprite):
     hitbox = Hitbox(size=Vec2(1, 3))
     color = colex.LIGHT_GRAY
     texture = load_texture("airlock/closed.txt")
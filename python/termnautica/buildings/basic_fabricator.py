@@ -4,9 +4,10 @@ from charz import Sprite
 from ..item import ItemID, Recipe
 from ..props import Interactable
 from ..fabrication import Fabrication
+from ..transforms import CachedTransform
 
 
-class BasicFabricator(Fabrication, Interactable, Sprite):
+class BasicFabricator(Fabrication, Interactable, CachedTransform, Sprite):
     _REACH = 4
     _REACH_FRACTION = 1
     _RECIPES = [
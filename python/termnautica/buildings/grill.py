@@ -5,9 +5,12 @@ from ..particles import Fire
 from ..props import Interactable
 from ..fabrication import Fabrication
 from ..item import ItemID, Recipe
+from ..ticks import Ticked, TickTier
 
 
-class Grill(Fabrication, Interactable, Sprite):
+class Grill(Ticked, Fabrication, Interactable, Sprite):
+    TICK_TIER = TickTier.INTERVAL
+    TICK_INTERVAL = 2
     _FIRE_OFFSET: Vec2 = Vec2(1, 0)
     _FIRE_EMMIT_INTERVAL: int = 8
     _RECIPES = [
@@ -40,8 +43,8 @@ class Grill(Fabrication, Interactable, Sprite):
     ]
     _time_since_emmit: int = 0
 
-    def update(self, _delta: float) -> None:
-        self._time_since_emmit -= 1
+    def tick(self, elapsed: int) -> None:
+        self._time_since_emmit -= elapsed
         if self._time_since_emmit <= 0:
             self._time_since_emmit = self._FIRE_EMMIT_INTERVAL
             Fire().with_global_position(self.global_position + self._FIRE_OFFSET)
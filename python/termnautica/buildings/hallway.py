@@ -1,10 +1,12 @@
 import colex
-from charz import Sprite, Collider, Hitbox, Node2D, Vec2, load_texture
+from charz import Sprite, Hitbox, Node2D, Vec2
 
+from ..assets import load_texture
+from ..collision import BroadphaseCollider
 from .airlock import Airlock
 
 
-class HallwayRoof(Collider, Node2D):
+class HallwayRoof(BroadphaseCollider, Node2D):
     hitbox = Hitbox(size=Vec2(29, 1))
 
 
@@ -1,13 +1,21 @@
 import colex
-from charz import Sprite, Label, Hitbox, Vec2, load_texture
+from charz import Sprite, Label, Hitbox, Vec2
 
+from ..assets import load_texture
 from ..player import Player
 from ..props import Interactable, Building
+from ..transforms import CachedTransform
 from .smelter import Smelter
 from .basic_fabricator import BasicFabricator
 
 
-class Ladder(Interactable, Sprite):
+class _Name(CachedTransform, Label): ...
+
+
+class _Overlay(CachedTransform, Sprite): ...
+
+
+class Ladder(Interactable, CachedTransform, Sprite):
     _REACH = 2
     _REACH_FRACTION = 2 / 1
     interactable = False
@@ -23,7 +31,7 @@ class Ladder(Interactable, Sprite):
 
 
 # TODO: Crafting | Fabricatror (Medkit), Radio, O2, Power (Solar), Storage
-class Lifepod(Interactable, Building, Sprite):
+class Lifepod(Interactable, Building, CachedTransform, Sprite):
     _BOUNDARY = Hitbox(size=Vec2(19, 9), centered=True)
     _OPEN_CEILING = True
     _REACH = 15
@@ -39,7 +47,7 @@ class Lifepod(Interactable, Building, Sprite):
     _curr_interactor: Player | None = None
 
     def __init__(self) -> None:
-        self._name = Label(
+        self._name = _Name(
             self,
             text="Lifepod",
             color=colex.ITALIC + colex.SLATE_GRAY,
@@ -53,7 +61,7 @@ class Lifepod(Interactable, Building, Sprite):
                 False
             ),
         ]
-        self._smelter_overlay = Sprite(
+        self._smelter_overlay = _Overlay(
             self._children[0],
             texture=["", Smelter.texture[1]],
         )
@@ -82,6 +90,10 @@ class Lifepod(Interactable, Building, Sprite):
     def update(self, _delta: float) -> None:
         if not self.interactable:
             self.z_index = 0
+        # Moved along with the waving water
+        self.update_spatial_hash()
+        for child in self._children:
+            child.update_spatial_hash()
 
     def on_exit(self) -> None:
         assert (
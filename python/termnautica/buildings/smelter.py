@@ -4,9 +4,10 @@ from charz import Sprite, Vec2
 from ..item import ItemID, Recipe
 from ..props import Interactable
 from ..fabrication import Fabrication
+from ..transforms import CachedTransform
 
 
-class Smelter(Fabrication, Interactable, Sprite):
+class Smelter(Fabrication, Interactable, CachedTransform, Sprite):
     _REACH = 3
     _REACH_CENTER = Vec2(3, 0.5)
     _RECIPES = [
@@ -0,0 +1,158 @@
+"""Collision between textures and terrain, and between `Collider` nodes.
+
+Terrain is stored as one integer per row, where each set bit is a solid cell.
+Textures are converted once into occupancy masks of the same layout,
+so testing a texture against the terrain is one shift and one `&` per texture line.
+
+`Collider` nodes are indexed in a broadphase grid, so a collision check only
+tests the colliders near the hitbox, instead of every collider in the world.
+"""
+
+from math import floor
+from typing import Any, ClassVar, Self
+
+from charz import Collider, Vec2
+
+from .spatial import SpatialHash
+
+
+type Coordinate = tuple[int, int]
+type Mask = tuple[int, ...]  # One row of bits per line, where bit 0 is leftmost cell
+
+
+def texture_mask(texture: list[str], transparency: str | None = None) -> Mask:
+    """Create occupancy mask of texture
+
+    Args:
+        texture (list[str]): texture to create mask of
+        transparency (str | None, optional): char that is not solid.
+            When `None`, the whole bounding box of the texture is solid.
+            Defaults to None.
+
+    Returns:
+        Mask: occupancy mask
+    """
+    width = len(max(texture, key=len)) if texture else 0
+    mask: list[int] = []
+    for line in texture:
+        bits = 0
+        for index in range(width):
+            if transparency is None or (
+                index < len(line) and line[index] != transparency
+            ):
+                bits |= 1 << index
+        mask.append(bits)
+    return tuple(mask)
+
+
+class BitGrid:
+    def __init__(self) -> None:
+        self.rows: dict[int, int] = {}
+        self.origin_x: int = 0  # X-position of bit 0 in every row
+
+    def add(self, point: Coordinate) -> None:
+        (x, y) = point
+        if x < self.origin_x:  # Rebase every row, so no bit index is negative
+            shift = self.origin_x - x
+            for row_y in self.rows:
+                self.rows[row_y] <<= shift
+            self.origin_x = x
+        self.rows[y] = self.rows.get(y, 0) | (1 << (x - self.origin_x))
+
+    def has(self, point: Coordinate) -> bool:
+        (x, y) = point
+        if x < self.origin_x:
+            return False
+        return bool(self.rows.get(y, 0) >> (x - self.origin_x) & 1)
+
+    def overlaps(self, mask: Mask, x: int, y: int) -> bool:
+        """Check if mask placed with its upper-left corner at `(x, y)` hits any solid cell
+
+        Args:
+            mask (Mask): occupancy mask, made with `texture_mask`
+            x (int): global X-position of upper-left corner
+            y (int): global Y-position of upper-left corner
+
+        Returns:
+            bool: whether it overlaps
+        """
+        shift = x - self.origin_x
+        for offset, mask_row in enumerate(mask):
+            row = self.rows.get(y + offset)
+            if not row:
+                continue
+            if shift >= 0:
+                if row & (mask_row << shift):
+                    return True
+            elif (row << -shift) & mask_row:
+                return True
+        return False
+
+    def resolve_motion(
+        self,
+        mask: Mask,
+        origin: Vec2,
+        velocity: Vec2,
+    ) -> tuple[bool, Vec2]:
+        """Find how far a mask can move, without ending up inside terrain
+
+        Motion is applied along Y-axis first, then X-axis.
+        An axis where the motion would end up overlapping is not moved at all.
+
+        Args:
+            mask (Mask): occupancy mask, made with `texture_mask`
+            origin (Vec2): global upper-left corner of mask
+            velocity (Vec2): wanted displacement
+
+        Returns:
+            tuple[bool, Vec2]: whether any axis collided, and the allowed displacement
+        """
+        allowed = velocity.copy()
+        if self.overlaps(mask, floor(origin.x), floor(origin.y + velocity.y)):
+            allowed.y = 0
+        if self.overlaps(
+            mask,
+            floor(origin.x + velocity.x),
+            floor(origin.y + allowed.y),
+        ):
+            allowed.x = 0
+        collided = allowed.x != velocity.x or allowed.y != velocity.y
+        return (collided, allowed)
+
+
+class BroadphaseCollider(Collider):  # Component (mixin class)
+    broadphase: ClassVar[SpatialHash[Any]] = SpatialHash(cell_size=16)
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        instance = super().__new__(cls, *args, **kwargs)
+        BroadphaseCollider.broadphase.insert(instance)
+        return instance
+
+    # NOTE: Call after moving, so `BroadphaseCollider.broadphase` stays up to date
+    def update_broadphase(self) -> None:
+        BroadphaseCollider.broadphase.move(self)
+
+    def get_nearby_colliders(self) -> list[Collider]:
+        # Candidates for the hitbox, which may or may not be colliding
+        start = self.global_position  # type: ignore
+        if self.hitbox.centered:
+            start -= self.hitbox.size / 2
+        center = start + self.hitbox.size / 2
+        radius = max(self.hitbox.size.x, self.hitbox.size.y) / 2
+        return [
+            node
+            for node in BroadphaseCollider.broadphase.query(center, radius)
+            if node is not self
+        ]
+
+    def get_colliders(self) -> list[Any]:
+        return [
+            node for node in self.get_nearby_colliders() if self.is_colliding_with(node)
+        ]
+
+    def is_colliding(self) -> bool:
+        return any(self.is_colliding_with(node) for node in self.get_nearby_colliders())
+
+    def _free(self) -> None:
+        BroadphaseCollider.broadphase.remove(self)
+        super()._free()
@@ -0,0 +1,310 @@
+"""Key state, collected once per frame into an immutable snapshot.
+
+Every key the game reads is listed in `KEYS`, and stored as one bit of a frame mask.
+Game code reads keys through `is_pressed`, which only looks at the snapshot of this frame,
+so the cost of reading input does not grow with the number of checks.
+
+Key state comes from a source, which is one of:
+- `TerminalReader` (default), a background thread reading raw terminal stdin.
+  It needs no privileges, but terminals only report key presses (and auto repeats),
+  so a key counts as held for a short window after it was last seen.
+- `poll_keyboard`, using the `keyboard` library, which needs root on Linux.
+- A recording, fed back with `set_source` (see `replay`).
+"""
+
+import os
+import sys
+import time
+import select
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from .lazy import lazy_import
+
+if TYPE_CHECKING:
+    import keyboard
+else:
+    keyboard = lazy_import("keyboard")  # Only imported as fallback
+
+
+type Key = str | int
+type Mask = int  # One bit per key, in order of `KEYS`
+type Backend = Literal["terminal", "keyboard"]
+
+
+ARROW_UP: int = 72
+ARROW_DOWN: int = 80
+
+# NOTE: Only append new keys, since the bit of each key is stored in recordings
+KEYS: tuple[Key, ...] = (
+    "a",
+    "d",
+    "w",
+    "s",
+    "e",
+    "1",
+    "2",
+    "3",
+    "space",
+    "tab",
+    "shift",
+    "enter",
+    "j",
+    "k",
+    ARROW_UP,
+    ARROW_DOWN,
+    "b",
+    "esc",
+    "f3",
+    "c",
+)
+_KEY_BITS: dict[Key, int] = {key: 1 << index for index, key in enumerate(KEYS)}
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Snapshot:
+    frame: int  # Number of polls before this one
+    mask: Mask
+    previous_mask: Mask = 0  # Of previous snapshot
+
+    def is_pressed(self, key: Key) -> bool:
+        assert key in _KEY_BITS, f"Key {key!r} is not in `KEYS`"
+        return bool(self.mask & _KEY_BITS[key])
+
+    def is_just_pressed(self, key: Key) -> bool:
+        assert key in _KEY_BITS, f"Key {key!r} is not in `KEYS`"
+        return bool(self.mask & ~self.previous_mask & _KEY_BITS[key])
+
+
+def poll_keyboard() -> Mask:
+    mask = 0
+    for key, bit in _KEY_BITS.items():
+        if keyboard.is_pressed(key):
+            mask |= bit
+    return mask
+
+
+_ESC: int = 0x1B
+
+
+def _escape_end(data: bytes, index: int) -> int | None:
+    """Find end of escape sequence, starting with escape at index
+
+    Sequences are either CSI (`ESC [`, parameters, then a final byte),
+    or SS3 (`ESC O`, then one byte). Escape followed by anything else
+    is not a sequence, so it ends right after the escape.
+
+    Args:
+        data (bytes): bytes read from terminal
+        index (int): index of escape in data
+
+    Returns:
+        int | None: index after sequence, or `None` if data ends before it does
+    """
+    start = index + 1
+    if start == len(data):
+        return None
+    if data[start] == ord("["):
+        end = start + 1
+        if end < len(data) and data[end] == ord("["):  # Linux console F1-F5
+            return end + 2 if end + 1 < len(data) else None
+        while end < len(data) and 0x20 <= data[end] <= 0x3F:
+            end += 1
+        if end == len(data):
+            return None
+        if 0x40 <= data[end] <= 0x7E:
+            return end + 1
+        return end  # Malformed, so only the bytes before are part of it
+    if data[start] == ord("O"):
+        return start + 2 if start + 1 < len(data) else None
+    return start
+
+
+def _is_cut_off(data: bytes) -> bool:
+    # Whether data ends with an escape, or within an escape sequence
+    escape = data.rfind(_ESC)
+    return escape != -1 and _escape_end(data, escape) is None
+
+
+class TerminalReader:
+    # Terminals wait before auto repeating a held key, so the first press is held longer
+    _INITIAL_HOLD: float = 0.5  # Seconds
+    _REPEAT_HOLD: float = 0.1  # Seconds, after a repeat of the same key
+    # Seconds to wait for the rest of an escape sequence, split over several reads
+    _ESCAPE_TIMEOUT: float = 0.025
+    # Escape sequences of keys in `KEYS`, where other escape sequences are dropped
+    _SEQUENCES: dict[bytes, tuple[Key, ...]] = {
+        b"\x1b[A": (ARROW_UP,),
+        b"\x1bOA": (ARROW_UP,),
+        b"\x1b[B": (ARROW_DOWN,),
+        b"\x1bOB": (ARROW_DOWN,),
+        b"\x1b[Z": ("shift", "tab"),
+        b"\x1bOR": ("f3",),
+        b"\x1b[13~": ("f3",),
+        b"\x1b[[C": ("f3",),  # Linux console
+    }
+    _CHARS: dict[int, tuple[Key, ...]] = {
+        ord(" "): ("space",),
+        ord("\t"): ("tab",),
+        ord("\r"): ("enter",),
+        ord("\n"): ("enter",),
+    }
+
+    def __init__(self, fileno: int) -> None:
+        self.fileno = fileno
+        self._held_until: dict[Key, float] = {}
+        self._last_seen: dict[Key, float] = {}
+        self._lock = threading.Lock()
+        self._is_running = False
+        self._thread: threading.Thread | None = None
+        self._terminal_state: list | None = None
+
+    def start(self) -> None:
+        import termios
+        import tty
+
+        self._terminal_state = termios.tcgetattr(self.fileno)
+        tty.setcbreak(self.fileno)  # Unbuffered and without echo
+        self._is_running = True
+        self._thread = threading.Thread(
+            target=self._read_loop,
+            name="terminal-input",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        import termios
+
+        self._is_running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        if self._terminal_state is not None:
+            termios.tcsetattr(self.fileno, termios.TCSADRAIN, self._terminal_state)
+            self._terminal_state = None
+
+    def poll(self) -> Mask:
+        now = time.monotonic()
+        mask = 0
+        with self._lock:
+            for key, held_until in self._held_until.items():
+                if now < held_until:
+                    mask |= _KEY_BITS[key]
+        return mask
+
+    def feed(self, data: bytes, now: float) -> None:
+        # Parse bytes read from terminal, and mark the keys in them as held
+        index = 0
+        while index < len(data):
+            if data[index] != _ESC:
+                self._press(self._keys_of(data[index]), now)
+                index += 1
+                continue
+            end = _escape_end(data, index)
+            if end is None:
+                if index + 1 == len(data):  # Lone, so the key itself
+                    self._press(("esc",), now)
+                break  # Cut off sequence, which is dropped
+            # NOTE: Escape followed by a key (Alt + key) is dropped, but not the key
+            self._press(self._SEQUENCES.get(data[index:end], ()), now)
+            index = end
+
+    def _keys_of(self, char: int) -> tuple[Key, ...]:
+        if char in self._CHARS:
+            return self._CHARS[char]
+        key = chr(char)
+        if key.isupper():
+            return ("shift", key.lower())
+        return (key,)
+
+    def _press(self, keys: tuple[Key, ...], now: float) -> None:
+        with self._lock:
+            for key in keys:
+                if key not in _KEY_BITS:
+                    continue
+                last_seen = self._last_seen.get(key)
+                is_repeat = last_seen is not None and now - last_seen < self._INITIAL_HOLD
+                hold = self._REPEAT_HOLD if is_repeat else self._INITIAL_HOLD
+                self._held_until[key] = now + hold
+                self._last_seen[key] = now
+
+    def _read_loop(self) -> None:
+        while self._is_running:
+            (readable, _, _) = select.select([self.fileno], [], [], 0.1)
+            if not readable:
+                continue
+            data = os.read(self.fileno, 64)
+            if not data:  # End of input
+                break
+            # Lone escape is only "esc" if no sequence follows shortly
+            while _is_cut_off(data):
+                (readable, _, _) = select.select(
+                    [self.fileno], [], [], self._ESCAPE_TIMEOUT
+                )
+                if not readable:
+                    break
+                more = os.read(self.fileno, 64)
+                if not more:
+                    break
+                data += more
+            self.feed(data, time.monotonic())
+
+
+_source: Callable[[], Mask] = poll_keyboard
+_reader: TerminalReader | None = None
+_snapshot: Snapshot = Snapshot(frame=0, mask=0)
+
+
+def set_source(source: Callable[[], Mask]) -> None:
+    global _source
+    _source = source
+
+
+def start(backend: Backend = "terminal") -> Backend:
+    """Start reading input from backend
+
+    Falls back to `"keyboard"` if stdin is not a terminal.
+
+    Args:
+        backend (Backend, optional): where to read input from. Defaults to "terminal".
+
+    Returns:
+        Backend: backend that was started
+    """
+    global _reader
+    if backend == "terminal" and sys.stdin.isatty():
+        _reader = TerminalReader(sys.stdin.fileno())
+        _reader.start()
+        set_source(_reader.poll)
+        return "terminal"
+    set_source(poll_keyboard)
+    return "keyboard"
+
+
+def stop() -> None:
+    # Restores terminal, if it was used
+    global _reader
+    if _reader is not None:
+        _reader.stop()
+        _reader = None
+
+
+def poll() -> Snapshot:  # Call from `App.update`
+    global _snapshot
+    _snapshot = Snapshot(
+        frame=_snapshot.frame + 1,
+        mask=_source(),
+        previous_mask=_snapshot.mask,
+    )
+    return _snapshot
+
+
+def snapshot() -> Snapshot:
+    return _snapshot
+
+
+def is_pressed(key: Key) -> bool:
+    return _snapshot.is_pressed(key)
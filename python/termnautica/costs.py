@@ -0,0 +1,175 @@
+"""Update and render cost, accounted per node class.
+
+Enabled with `termnautica --cost-report FILE`. While enabled, `App.tick` times
+the `update` of every node, and counts the cells every visible texture covers,
+which is what `render_all` rasterizes. Every `export_interval` frames,
+a summary per class is appended to the report, and the window starts over.
+
+The report is CSV if the file name ends with `.csv`, and JSON lines otherwise.
+Percentiles are over frames in the window, of the total time (or cells) of a class.
+"""
+
+import csv
+import json
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, ClassVar
+
+from charz import Camera, Node, Screen, Texture, Vec2
+
+from .gametime import GameTime
+from .ticks import Ticked, TickScheduler
+
+
+_PERCENTILES: tuple[int, ...] = (50, 95, 99)
+_CSV_FIELDS: tuple[str, ...] = (
+    "frame",
+    "class",
+    "calls",
+    "update_ms_total",
+    *(f"update_ms_p{percent}" for percent in _PERCENTILES),
+    *(f"cells_p{percent}" for percent in _PERCENTILES),
+)
+
+
+def percentile(values: Sequence[float], percent: int) -> float:
+    # Nearest rank, of `values` sorted in ascending order
+    if not values:
+        return 0
+    rank = max(1, -(-percent * len(values) // 100))  # Ceiling division
+    return values[rank - 1]
+
+
+class CostAccounting:
+    is_enabled: ClassVar[bool] = False
+    is_counting_cells: ClassVar[bool] = True
+    export_path: ClassVar[Path | None] = None  # Only kept in memory when `None`
+    export_interval: ClassVar[int] = 160  # Frames, 10 seconds at 16 FPS
+    # Window, by class name
+    _calls: ClassVar[defaultdict[str, int]] = defaultdict(int)
+    _update_times: ClassVar[defaultdict[str, list[float]]] = defaultdict(list)
+    _cells: ClassVar[defaultdict[str, list[int]]] = defaultdict(list)
+    _window_frames: ClassVar[int] = 0
+
+    @classmethod
+    def enable(
+        cls,
+        export_path: Path | None,
+        export_interval: int | None = None,
+    ) -> None:
+        cls.is_enabled = True
+        cls.export_path = export_path
+        if export_interval is not None:
+            cls.export_interval = export_interval
+        if export_path is not None:
+            export_path.unlink(missing_ok=True)  # New report for each session
+
+    @classmethod
+    def add_update_time(cls, name: str, seconds: float) -> None:
+        # For updates outside of nodes, like `App.update`
+        cls._calls[name] += 1
+        cls._update_times[name].append(seconds)
+
+    @classmethod
+    def update_nodes(cls, delta: float) -> None:  # Call from `App.tick`
+        # Same as `TickScheduler.update_nodes`, while timing each node
+        frame_times: defaultdict[str, float] = defaultdict(float)
+        for node in list(Node.node_instances.values()):
+            if isinstance(node, Ticked):
+                continue
+            start = time.perf_counter()
+            node.update(delta)
+            name = node.__class__.__name__
+            frame_times[name] += time.perf_counter() - start
+            cls._calls[name] += 1
+        for node in TickScheduler.due():
+            start = time.perf_counter()
+            TickScheduler.tick(node)
+            name = node.__class__.__name__
+            frame_times[name] += time.perf_counter() - start
+            cls._calls[name] += 1
+        for name, seconds in frame_times.items():
+            cls._update_times[name].append(seconds)
+
+    @classmethod
+    def count_cells(cls, screen: Screen) -> None:  # Call from `App.tick`
+        # Cells covered by visible textures in view, like `render_all` would draw
+        if not cls.is_counting_cells:
+            return
+        center = Camera.current.global_position
+        size = screen.get_actual_size()
+        frame_cells: defaultdict[str, int] = defaultdict(int)
+        for node in Texture.texture_instances.values():
+            if not node.is_globally_visible():  # type: ignore
+                continue
+            position: Vec2 = node.global_position  # type: ignore
+            texture_size = node.texture_size
+            if (
+                abs(position.x - center.x) > (size.x + texture_size.x) / 2
+                or abs(position.y - center.y) > (size.y + texture_size.y) / 2
+            ):
+                continue
+            transparency = node.transparency
+            cells = 0
+            for line in node.texture:
+                cells += len(line)
+                if transparency is not None:
+                    cells -= line.count(transparency)
+            frame_cells[node.__class__.__name__] += cells
+        for name, cells in frame_cells.items():
+            cls._cells[name].append(cells)
+
+    @classmethod
+    def end_frame(cls) -> None:  # Call from `App.tick`
+        cls._window_frames += 1
+        if cls.export_path is not None and cls._window_frames >= cls.export_interval:
+            cls.export()
+
+    @classmethod
+    def summary(cls) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        for name in sorted(cls._update_times.keys() | cls._cells.keys()):
+            update_times = sorted(cls._update_times[name])
+            cells = sorted(cls._cells[name])
+            row: dict[str, Any] = {
+                "frame": GameTime.frame,
+                "class": name,
+                "calls": cls._calls[name],
+                "update_ms_total": round(sum(update_times) * 1000, 3),
+            }
+            for percent in _PERCENTILES:
+                row[f"update_ms_p{percent}"] = round(
+                    percentile(update_times, percent) * 1000, 3
+                )
+            for percent in _PERCENTILES:
+                row[f"cells_p{percent}"] = percentile(cells, percent)
+            rows.append(row)
+        return rows
+
+    @classmethod
+    def export(cls) -> None:
+        # Append summary of window to report, and start a new window
+        if cls.export_path is None or cls._window_frames == 0:
+            return
+        rows = cls.summary()
+        if cls.export_path.suffix == ".csv":
+            is_new = not cls.export_path.exists()
+            with cls.export_path.open("a", newline="", encoding="utf-8") as file:
+                writer = csv.DictWriter(file, fieldnames=_CSV_FIELDS)
+                if is_new:
+                    writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with cls.export_path.open("a", encoding="utf-8") as file:
+                record = {
+                    "frame": GameTime.frame,
+                    "frames": cls._window_frames,
+                    "classes": rows,
+                }
+                file.write(json.dumps(record) + "\n")
+        cls._calls.clear()
+        cls._update_times.clear()
+        cls._cells.clear()
+        cls._window_frames = 0
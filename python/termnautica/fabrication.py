@@ -3,24 +3,14 @@ from typing import TYPE_CHECKING
 from charz import Sprite
 
 from .props import Crafting
-from .item import ItemID
+from .inventory import Inventory
+from .recipe import CraftabilityIndex
+from .lazy import lazy_import
 
-
-# Type checking for lazy loading
 if TYPE_CHECKING:
-    from .player import Player
+    from . import player
 else:
-    Player = None
-
-
-def _ensure_player() -> None:
-    # Lazy loading - A quick workaround
-    global Player
-    if Player is None:
-        from .player import Player
-
-
-type Count = int
+    player = lazy_import(".player", __package__)  # Import cycle
 
 
 # NOTE: Has to be *before* `Interactable` in mro
@@ -49,7 +39,7 @@ class Fabrication(Crafting):  # Extended Component (mixin class)
 
     def can_craft_by_index(
         self,
-        inventory: dict[ItemID, Count],
+        inventory: Inventory,
     ) -> bool:
         # Use local mutable variable
         recipe = self._RECIPES[self._selected_recipe_index]
@@ -57,30 +47,48 @@ class Fabrication(Crafting):  # Extended Component (mixin class)
 
     def craft_by_index(
         self,
-        inventory: dict[ItemID, Count],
+        inventory: Inventory,
     ) -> None:
         # Use local mutable variable
         recipe = self._RECIPES[self._selected_recipe_index]
         self.craft(recipe, inventory)
 
+    def craft_batch_by_index(
+        self,
+        craftability: CraftabilityIndex,
+        *,
+        all_possible: bool = False,
+    ) -> bool:
+        # Use local mutable variable
+        recipe = self._RECIPES[self._selected_recipe_index]
+        count = craftability.max_craftable(recipe) if all_possible else 1
+        if count == 0:
+            return False
+        return craftability.craft(recipe, count)
+
     def when_selected(self, actor: Sprite) -> None:
-        _ensure_player()
         assert isinstance(
             actor,
-            Player,
+            player.Player,
         ), "Only `Player` can select `BasicFabricator`"
         actor.crafting_gui.show()
+        # Only update GUI when selection or inventory changed
+        state = (self.uid, self._selected_recipe_index, actor.inventory.version)
+        if actor.crafting_gui.shown_state == state:
+            return
+        actor.crafting_gui.shown_state = state
         all_recipe_states = [
             (
                 recipe,
                 self.can_craft(recipe, actor.inventory),
+                actor.craftability.max_craftable(recipe),
             )
             for recipe in self._RECIPES
         ]
         # TODO: Implement `selected_recipe_index`
         recipe = self._RECIPES[self._selected_recipe_index]
         selected_idgredient_counts = tuple(
-            actor.inventory.get(item, 0) for item in recipe.idgredients
+            actor.inventory.get_count(item) for item in recipe.idgredients
         )
         actor.crafting_gui.update_from_recipe(
             recipe,
@@ -89,18 +97,16 @@ class Fabrication(Crafting):  # Extended Component (mixin class)
         )
 
     def on_deselect(self, actor: Sprite) -> None:
-        _ensure_player()
         assert isinstance(
             actor,
-            Player,
+            player.Player,
         ), "Only `Player` can select `BasicFabricator`"
         actor.crafting_gui.hide()
 
     def on_interact(self, actor: Sprite) -> None:
-        _ensure_player()
         assert isinstance(
             actor,
-            Player,
+            player.Player,
         ), "Only `Player` can interact with `BasicFabricator`"
         if self.can_craft_by_index(actor.inventory):
             self.craft_by_index(actor.inventory)
@@ -1,22 +1,24 @@
 import random
 from enum import ReprEnum, Enum, auto
-from typing import TYPE_CHECKING, assert_never
+from typing import TYPE_CHECKING, Any, ClassVar, assert_never
 
-import pygame
 import colex
 from colex import ColorValue
 from charz import Sprite, Vec2, text, clamp, sign
 
+from . import audio
 from .props import Collectable, Interactable
+from .registry import Registered
+from .pursuit import FlowField
 from .player import Player
 from .item import ItemID
-from .utils import move_toward
+from .utils import move_toward, flipped_h
+from .lazy import lazy_import
 
-# Type checking for lazy loading
 if TYPE_CHECKING:
     from . import ocean
 else:
-    ocean = None
+    ocean = lazy_import(".ocean", __package__)  # Import cycle
 
 
 # Expand text flipping db
@@ -24,13 +26,6 @@ text._h_conversions["»"] = "«"
 text._h_conversions["«"] = "»"
 
 
-def _ensure_ocean() -> None:
-    # Lazy loading - A quick workaround
-    global ocean
-    if ocean is None:
-        from . import ocean
-
-
 type MinFrameTime = int
 type MaxFrameTime = int
 
@@ -48,7 +43,7 @@ class Direction(Enum):
     NONE = auto()
 
 
-class FishAI:
+class FishAI(Registered):
     _SPEED_SCALE: float = 0.1
     _ACCELERATION: Vec2 = Vec2(0.2, 1.1)
     _FRICTION: Vec2 = Vec2(0.15, 0.50)
@@ -59,8 +54,18 @@ class FishAI:
     _state: FishState = FishState.IDLE
     _direction: Direction = Direction.LEFT  # Sprites are drawn facing left
     _action_time_remaining: int = 0
+    # Class texture and its mirror, set for each subclass
+    _TEXTURE_LEFT: ClassVar[list[str]] = []
+    _TEXTURE_RIGHT: ClassVar[list[str]] = []
     assert _ACCELERATION > _FRICTION, "Invalid constants"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        texture = getattr(cls, "texture", None)
+        if texture is not None:
+            cls._TEXTURE_LEFT = texture
+            cls._TEXTURE_RIGHT = flipped_h(texture)
+
     def update(self, _delta: float) -> None:
         assert isinstance(self, Sprite), f"`Sprite` base missing for {self}"
 
@@ -96,9 +101,10 @@ class FishAI:
             self.speed_y += self._ACCELERATION.y
             self.speed_y = clamp(self.speed_y, -self._MAX_SPEED.y, self._MAX_SPEED.y)
         self.position.y += self.speed_y * self._SPEED_SCALE
+        if isinstance(self, Interactable):
+            self.update_spatial_hash()
 
     def is_submerged(self) -> bool:
-        _ensure_ocean()  # Lazy load `OceanWater`
         assert isinstance(self, Sprite), f"`Sprite` base missing for {self}"
         self_height = self.global_position.y - self.texture_size.y / 2
         wave_height = ocean.Water.wave_height_at(self.global_position.x)
@@ -116,10 +122,10 @@ class FishAI:
         if self._direction is Direction.NONE:
             if random.randint(0, 1):
                 self._direction = Direction.LEFT
-                self.texture = self.__class__.texture
+                self.texture = self._TEXTURE_LEFT
             else:
                 self._direction = Direction.RIGHT
-                self.texture = text.flip_lines_h(self.__class__.texture)
+                self.texture = self._TEXTURE_RIGHT
 
         if self._direction is Direction.LEFT:
             self.speed_x -= acceleration
@@ -133,12 +139,12 @@ class FishAI:
 
 
 class BaseFish(FishAI, Interactable, Collectable, Sprite):
-    _SOUND_COLLECT = pygame.mixer.Sound("assets/sounds/collect/fish.wav")
+    _SOUND_COLLECT = audio.load("assets/sounds/collect/fish.wav")
     centered = True
 
 
 class SmallFish(BaseFish):
-    _SOUND_COLLECT = pygame.mixer.Sound("assets/sounds/collect/small_fish.wav")
+    _SOUND_COLLECT = audio.load("assets/sounds/collect/small_fish.wav")
     _ITEM = ItemID.GOLD_FISH
     color = colex.DARK_SALMON
     texture = ["<><"]
@@ -164,17 +170,31 @@ class WaterFish(BaseFish):
 
 # TODO: Add achievement for this
 class Nemo(BaseFish):
-    _SOUND_COLLECT = pygame.mixer.Sound("assets/sounds/collect/nemo.wav")
+    _SOUND_COLLECT = audio.load(
+        "assets/sounds/collect/nemo.wav",
+        prefetch=False,  # Rare
+    )
     _ITEM = ItemID.NEMO
     color = colex.LIGHT_SALMON
     texture = ["<)))<"]
 
 
 class SwordFish(FishAI, Sprite):
-    _SOUND_LURK = pygame.mixer.Sound("assets/sounds/collect/hostile_fish_lurk.wav")
-    _CHANNEL_LURK = pygame.mixer.Channel(4)
+    _SOUND_LURK = audio.load(
+        "assets/sounds/collect/hostile_fish_lurk.wav",
+        prefetch=False,  # Rare
+    )
     _SOUND_LURK_CHANCE: int = 2000  # 1 out of X chance
     _STEALTH_COLOR: ColorValue = colex.from_hex("#2B2B2B")
+    # NOTE: Both are straight line distances, and the field only decides
+    #       whether the player can be reached around terrain, and in what direction
+    _CHASE_DISTANCE: int = 20
+    _ATTACK_DISTANCE: int = 4
+    # Shared by every `SwordFish`, recomputed at most every few frames
+    _PURSUIT_FIELD: ClassVar[FlowField] = FlowField(
+        radius=_CHASE_DISTANCE,
+        refresh_interval=4,
+    )
     # color = colex.from_hex("#adcdc0")
     color = colex.from_hex("#ffd966")
     # texture = ["«««Ó(((()><"]
@@ -182,33 +202,39 @@ class SwordFish(FishAI, Sprite):
     texture = ["«««Ó((ΞΞΞΞx<"]
 
     def update(self, _delta: float) -> None:
-        # TODO: Add spatial sound
-        if (
-            random.randint(1, self._SOUND_LURK_CHANCE) == 1
-            and not self._CHANNEL_LURK.get_busy()
-        ):
-            self._CHANNEL_LURK.play(self._SOUND_LURK)
+        if random.randint(1, self._SOUND_LURK_CHANCE) == 1:
+            self._SOUND_LURK.play(
+                priority=audio.Priority.AMBIENT,
+                position=self.global_position,
+                exclusive=True,
+            )
         # TODO: Refactor this quick solution
         super().update(0)  # Process `FishAI`
         if not self.is_submerged():
             return
-        for node in Sprite.texture_instances.values():
-            if isinstance(node, Player):
-                if node.is_in_building():
-                    self.color = self.__class__.color
-                    continue
-                dist = self.global_position.distance_to(node.global_position)
-                if dist < 20:
-                    direction = self.global_position.direction_to(node.global_position)
-                    self.position += direction * 0.5
-                    if sign(direction.x) == 1:
-                        self.texture = text.flip_lines_h(self.__class__.texture)
-                    else:
-                        self.texture = self.__class__.texture
-                    self.color = self._STEALTH_COLOR
-                if dist < 4:
-                    node._health_bar.value -= 1
-                    self.color = self.__class__.color
-                if dist >= 20:
-                    self.color = self.__class__.color
-                break
+        for player in Player.instances():
+            if player.is_in_building():
+                self.color = self.__class__.color
+                continue
+            self._PURSUIT_FIELD.refresh(
+                player.global_position,
+                ocean.Floor.has_point_inside,
+            )
+            global_point = self.global_position  # Store property value
+            dist = global_point.distance_to(player.global_position)
+            is_reachable = self._PURSUIT_FIELD.distance_at(global_point) is not None
+            is_chasing = dist < self._CHASE_DISTANCE and is_reachable
+            if is_chasing:
+                direction = self._PURSUIT_FIELD.direction_at(global_point)
+                self.position += direction * 0.5
+                if sign(direction.x) == 1:
+                    self.texture = self._TEXTURE_RIGHT
+                else:
+                    self.texture = self._TEXTURE_LEFT
+                self.color = self._STEALTH_COLOR
+            if dist < self._ATTACK_DISTANCE:
+                player._health_bar.value -= 1
+                self.color = self.__class__.color
+            if not is_chasing:
+                self.color = self.__class__.color
+            break
@@ -0,0 +1,54 @@
+"""Game time, shared by everything that counts frames.
+
+Game time is calculated in frames (int), because delta time is unstable at the moment.
+Callbacks can be scheduled for a later frame, and are called from `GameTime.advance`,
+in order of frame, then in order of scheduling.
+"""
+
+import heapq
+from collections.abc import Callable
+from typing import ClassVar
+
+
+class ScheduledEvent:
+    __slots__ = ("frame", "callback", "is_cancelled")
+
+    def __init__(self, frame: int, callback: Callable[[], None]) -> None:
+        self.frame = frame
+        self.callback = callback
+        self.is_cancelled = False
+
+    def cancel(self) -> None:
+        # Left in heap, and skipped when due
+        self.is_cancelled = True
+
+
+class GameTime:
+    frame: ClassVar[int] = 0  # Frames since start
+    _events: ClassVar[list[tuple[int, int, ScheduledEvent]]] = []  # Heap
+    _event_count: ClassVar[int] = 0  # Breaks ties, in order of scheduling
+
+    @classmethod
+    def advance(cls) -> None:  # Call from `App.update`
+        cls.frame += 1
+        # Events scheduled by callbacks for this frame are also called
+        while cls._events and cls._events[0][0] <= cls.frame:
+            (_, _, event) = heapq.heappop(cls._events)
+            if not event.is_cancelled:
+                event.callback()
+
+    @classmethod
+    def schedule(cls, frame: int, callback: Callable[[], None]) -> ScheduledEvent:
+        """Call callback when game time reaches frame
+
+        Args:
+            frame (int): frame to call at, the next frame if already reached
+            callback (Callable[[], None]): function to call
+
+        Returns:
+            ScheduledEvent: event, which can be cancelled
+        """
+        event = ScheduledEvent(frame, callback)
+        cls._event_count += 1
+        heapq.heappush(cls._events, (frame, cls._event_count, event))
+        return event
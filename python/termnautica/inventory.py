@@ -0,0 +1,98 @@
+"""Item counts, stored in a list indexed by `ItemID` ordinal.
+
+`Inventory` is a mutable mapping of the items that have a positive count,
+so an item set to `0` is removed, and negative counts are rejected.
+Every change increments `version`, which lets readers (like `ui.Inventory`)
+skip work when nothing has changed, and calls each subscribed listener with
+the item, its old count and its new count.
+"""
+
+from collections.abc import Callable, Iterator, MutableMapping
+
+from .item import ItemID
+
+
+type Count = int
+type Listener = Callable[[ItemID, Count, Count], None]  # Item, old and new count
+
+
+_ITEMS: tuple[ItemID, ...] = tuple(ItemID)
+# NOTE: `ItemID` values start at 1, from `auto()`
+assert all(item.value == ordinal + 1 for ordinal, item in enumerate(_ITEMS))
+
+
+class Inventory(MutableMapping[ItemID, Count]):
+    def __init__(self) -> None:
+        self._counts: list[Count] = [0] * len(_ITEMS)
+        self._size = 0  # Items with a positive count
+        self._listeners: list[Listener] = []
+        self.version = 0  # Incremented on every change
+
+    def __getitem__(self, item: ItemID) -> Count:
+        count = self._counts[item.value - 1]
+        if count == 0:
+            raise KeyError(item)
+        return count
+
+    def __setitem__(self, item: ItemID, count: Count) -> None:
+        if count < 0:
+            raise ValueError(f"Item {repr(item)} has negative count: {count}")
+        ordinal = item.value - 1
+        old_count = self._counts[ordinal]
+        if count == old_count:
+            return
+        self._counts[ordinal] = count
+        if old_count == 0:
+            self._size += 1
+        elif count == 0:
+            self._size -= 1
+        self.version += 1
+        for listener in self._listeners:
+            listener(item, old_count, count)
+
+    def __delitem__(self, item: ItemID) -> None:
+        if self._counts[item.value - 1] == 0:
+            raise KeyError(item)
+        self[item] = 0
+
+    def __contains__(self, item: object) -> bool:
+        return isinstance(item, ItemID) and self._counts[item.value - 1] != 0
+
+    def __iter__(self) -> Iterator[ItemID]:
+        # In order of `ItemID`
+        for ordinal, count in enumerate(self._counts):
+            if count:
+                yield _ITEMS[ordinal]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+    def get_count(self, item: ItemID) -> Count:
+        # Same as `inventory.get(item, 0)`, without a `KeyError` on the way
+        return self._counts[item.value - 1]
+
+    def add(self, item: ItemID, count: Count = 1) -> None:
+        self[item] = self._counts[item.value - 1] + count
+
+    def remove(self, item: ItemID, count: Count = 1) -> None:
+        current = self._counts[item.value - 1]
+        if current == 0:
+            raise KeyError(
+                f"Attempted removing {count} {item.name},"
+                f" but {item.name} is not found in {self}"
+            )
+        if count > current:
+            raise ValueError(
+                f"Attempted to remove {count} {item.name},"
+                f" but only has {current} in {self}"
+            )
+        self[item] = current - count
+
+    def subscribe(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        self._listeners.remove(listener)
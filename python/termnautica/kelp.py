@@ -1,21 +1,22 @@
 import colex
-from charz import AnimatedSprite, AnimationSet, Animation, Sprite, Vec2
+from charz import Sprite, Vec2
 
+from .animation import ClockAnimated
+from .assets import load_animation
 from .props import Collectable, Interactable
 from .item import ItemID
 
 
-class Kelp(Interactable, Collectable, AnimatedSprite):
+class Kelp(Interactable, Collectable, ClockAnimated, Sprite):
     _ITEM = ItemID.KELP
     color = colex.SEA_GREEN
     transparency = " "
-    animations = AnimationSet(
-        Sway=Animation("kelp"),
-    )
+    frame_sets = {
+        "Sway": (tuple(load_animation("kelp").frames),),
+    }
+    animation = "Sway"
     repeat = True
-    is_playing = True
-    current_animation = animations.Sway
-    texture = current_animation.frames[0]
+    texture = frame_sets["Sway"][0][0]
 
     def __init__(self) -> None:
         self._supporting_sand = Sprite(
@@ -0,0 +1,53 @@
+"""Modules that are imported on first attribute access.
+
+Used where a module can't be imported at the top, because of an import cycle
+(like `fish` -> `ocean` -> `spawners` -> `fish`), or because it is heavy
+and not needed before the game starts (like `pygame`).
+
+Usage:
+    if TYPE_CHECKING:
+        from . import ocean
+    else:
+        ocean = lazy_import(".ocean", __package__)
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    def __init__(self, name: str, package: str | None = None) -> None:
+        super().__init__(name)
+        self._lazy_package = package
+        self._lazy_module: ModuleType | None = None
+
+    def load(self) -> ModuleType:
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self.__name__, self._lazy_package)
+        return self._lazy_module
+
+    def is_loaded(self) -> bool:
+        return self._lazy_module is not None
+
+    # NOTE: Attributes are not cached, so globals rebound in the module stay up to date
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded() else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str, package: str | None = None) -> Any:
+    """Get module that is imported the first time an attribute is accessed
+
+    Args:
+        name (str): module name, which may be relative like `".ocean"`
+        package (str | None, optional): package to resolve relative name from,
+            usually `__package__`. Defaults to None.
+
+    Returns:
+        Any: stand-in for module, typed as `Any` so attribute access type checks
+    """
+    return LazyModule(name, package)
@@ -5,8 +5,10 @@ from typing import Self, ClassVar
 import colex
 from charz import Sprite, Vec2, Vec2i
 
-from . import spawners
-from .utils import groupwise, randf
+from . import spawners, worldgen
+from .collision import BitGrid
+from .transforms import CachedTransform
+from .utils import groupwise
 
 
 type Coordinate = tuple[int, int]
@@ -30,19 +32,26 @@ class Floor(Sprite):
     z_index = -1
     color = colex.from_hex("#C2B280")
     texture = ["_"]
-    # TODO: Might be faster to have `points` be of type `dict[int, int]`,
-    #       where the key is X-position, and value is Y-position.
-    #       This way, an instant lookup can be done on X-position,
-    #       which is the first required information part
     points: ClassVar[set[Coordinate]] = set()
+    # Same points as bitmask rows - Used for collision with textures
+    grid: ClassVar[BitGrid] = BitGrid()
+    # Highest Y-position (smallest value) of any point, per X-position
+    surface: ClassVar[dict[int, int]] = {}
+    abyss_points: ClassVar[set[Coordinate]] = set()  # Points on abyss floors
+
+    @classmethod
+    def add_point(cls, point: Coordinate) -> None:
+        cls.points.add(point)
+        cls.grid.add(point)
+        (x, y) = point
+        if x not in cls.surface or y < cls.surface[x]:
+            cls.surface[x] = y
 
     @classmethod
     def has_point_inside(cls, point: Coordinate) -> bool:
         # With "Inside", I mean under any tile in Y-axis (including tile location itself)
-        for floor in cls.points:
-            if floor[0] == point[0] and floor[1] <= point[1]:
-                return True
-        return False
+        (x, y) = point
+        return x in cls.surface and cls.surface[x] <= y
 
     @classmethod
     def has_loose_point_inside(cls, point: Vec2) -> bool:
@@ -51,7 +60,7 @@ class Floor(Sprite):
         return cls.has_point_inside(snapped)
 
 
-class Water(Sprite):
+class Water(CachedTransform, Sprite):  # Parent of `Lifepod`
     _REST_LEVEL: float = 0  # Where the ocean rests, in world space
     _WAVE_AMPLITUDE: float = 2
     _WAVE_INTERVAL: float = 3 * 16  # frames
@@ -96,19 +105,6 @@ class Water(Sprite):
         )
 
 
-class Abyss:
-    SPAWN_CHANCE: ClassVar[int] = 200  # 1 out of X chance
-    MIN_WIDTH: ClassVar[int] = 10
-    MAX_WIDTH: ClassVar[int] = 20
-    MIN_DEPTH: ClassVar[int] = 20
-    MAX_DEPTH: ClassVar[int] = 60
-    length_left: ClassVar[int] = 0
-    current_depth: ClassVar[int] = 0
-    just_began: ClassVar[bool] = False
-    just_ended: ClassVar[bool] = False
-    floor_points: ClassVar[set[Coordinate]] = set()
-
-
 def generate_water() -> None:
     for x in range(WIDTH):
         (
@@ -121,79 +117,47 @@ def generate_water() -> None:
         )
 
 
-def attempt_generate_spawner_at(location: Vec2) -> None:
-    all_spawners = list(SPAWN_CHANCES.keys())
-    random.shuffle(all_spawners)
-    for spawner in all_spawners:
-        chance = SPAWN_CHANCES[spawner]
-        if random.randint(1, 100) <= chance:
-            spawner().with_global_position(location + spawner.position)
-            break
-
-
-def generate_floor():
-    depth = 0
-    texture_points: list[Vec2] = []
-
-    for x_position in range(-WIDTH // 2, WIDTH // 2):
-        # Check if starting to generate an abyss
-        if not Abyss.length_left and random.randint(1, Abyss.SPAWN_CHANCE) == 1:
-            Abyss.just_began = True
-            Abyss.current_depth = random.randint(
-                Abyss.MIN_DEPTH,
-                Abyss.MAX_DEPTH,
-            )
-            Abyss.length_left = random.randint(
-                Abyss.MIN_WIDTH,
-                Abyss.MAX_WIDTH,
+def generate_floor(max_workers: int | None = None) -> None:
+    """Generate ocean floor, and the spawners on it
+
+    Segments of the floor are generated in parallel by `worldgen`,
+    and merged into nodes here, in order from left.
+
+    Args:
+        max_workers (int | None, optional): worker processes, for wide worlds.
+            Defaults to None, which is one per core.
+    """
+    spawner_kinds = list(SPAWN_CHANCES.keys())
+    segments = worldgen.generate_segments(
+        random.getrandbits(64),  # World seed, from the seeded global stream
+        WIDTH,
+        tuple(SPAWN_CHANCES.values()),
+        max_workers,
+    )
+    texture_points: list[tuple[Vec2i, worldgen.FloorPoint]] = []
+    depth_offset = Floor.REST_DEPTH
+    for segment in segments:
+        # Continue where previous segment ended
+        for floor_point in segment.points:
+            point = Vec2i(floor_point.x, floor_point.y + depth_offset)
+            Floor.add_point(point.to_tuple())
+            texture_points.append((point, floor_point))
+        for x, y in segment.abyss_points:
+            Floor.abyss_points.add((x, y + depth_offset))
+        for x, y in segment.crystal_points:
+            spawners.CrystalSpawner().with_global_position(
+                Vec2i(x, y + depth_offset) + spawners.CrystalSpawner.position
             )
-
-        depth += randf(-1, 1)
-        point = Vec2i(x_position, int(depth) + Floor.REST_DEPTH)
-
-        if Abyss.length_left:
-            point.y += Abyss.current_depth
-            Abyss.floor_points.add(point.to_tuple())
-            Abyss.length_left -= 1
-            if Abyss.length_left == 0:
-                Abyss.just_ended = True
-
-        # Temp point - For deciding texture
-        texture_points.append(point)
-
-        # Generate abyss walls + `CrystalSpawner`
-        if Abyss.just_began or Abyss.just_ended:
-            Abyss.just_ended = False
-            Abyss.just_began = False
-            for i in range(Abyss.current_depth):
-                abyss_wall_point = Vec2i(
-                    x_position,
-                    int(depth) + Floor.REST_DEPTH + i,
-                )
-                abyss_wall_point.x += random.randint(-1, 0)
-                Floor.points.add(abyss_wall_point.to_tuple())
-                texture_points.append(abyss_wall_point)
-                if random.randint(1, 30) == 1:
-                    spawners.CrystalSpawner().with_global_position(
-                        abyss_wall_point + spawners.CrystalSpawner.position
-                    )
-
-        # Store point over time - Used for collision
-        Floor.points.add(point.to_tuple())
+        depth_offset += round(segment.end_depth)
 
     # FIXME: Implement properly - Almost working
-    for prev, curr, peak in groupwise(texture_points, n=3):
+    for (prev, _), (curr, rolls), (peak, _) in groupwise(texture_points, n=3):
         is_climbing = peak.y - curr.y < 0
         is_flatting = abs(peak.y - curr.y) < 0.8
         was_dropping = curr.y - prev.y > 0
         is_steep = curr.y - prev.y >= 1 and peak.y - curr.y >= 1
         if is_steep:
-            ocean_floor = Floor(position=curr, texture=["|"])
-            if random.randint(1, 3) == 1:
-                if random.randint(1, 2) == 1:
-                    ocean_floor.texture = ["<"]
-                else:
-                    ocean_floor.texture = [">"]
+            ocean_floor = Floor(position=curr, texture=[rolls.steep_glyph])
         elif is_flatting:
             ocean_floor = Floor(position=curr)
         elif is_climbing and was_dropping:
@@ -211,14 +175,12 @@ def generate_floor():
             ocean_floor.color = colex.GRAY
         if is_steep:  # Don't generate spawners in too steep terrain
             continue
-        snapped = (
-            floor(curr.x),
-            floor(curr.y),
-        )
-        if snapped in Abyss.floor_points:
-            if random.randint(1, 8) == 1:
+        if curr.to_tuple() in Floor.abyss_points:
+            if rolls.has_diamond:
                 spawners.DiamondOreSpawner().with_global_position(
                     curr + spawners.DiamondOreSpawner.position
                 )
             continue
-        attempt_generate_spawner_at(curr)
+        if rolls.spawner != worldgen.NO_SPAWNER:
+            spawner = spawner_kinds[rolls.spawner]
+            spawner().with_global_position(curr + spawner.position)
@@ -1,17 +1,18 @@
 import random
 
-import pygame
 import colex
 from colex import ColorValue
 from charz import Sprite
 
+from . import audio
 from .props import Collectable, Interactable
 from .item import ItemID
 from .particles import ShineSpark
+from .ticks import Ticked, TickTier
 
 
 class Ore(Interactable, Collectable, Sprite):
-    _SOUND_COLLECT = pygame.mixer.Sound("assets/sounds/collect/ore.wav")
+    _SOUND_COLLECT = audio.load("assets/sounds/collect/ore.wav")
     color = colex.DARK_GRAY
     z_index = 1
     texture = ["<Unset Ore Texture>"]
@@ -36,14 +37,14 @@ class Copper(Ore):
 
 
 class Coal(Ore):
-    _SOUND_COLLECT = pygame.mixer.Sound("assets/sounds/collect/coal.wav")
+    _SOUND_COLLECT = audio.load("assets/sounds/collect/coal.wav")
     _ITEM = ItemID.COAL_ORE
     color = colex.BLACK
     texture = ["▒▓▒"]
 
 
-class Crystal(Ore):
-    _SOUND_COLLECT = pygame.mixer.Sound("assets/sounds/collect/crystal.wav")
+class Crystal(Ticked, Ore):
+    _SOUND_COLLECT = audio.load("assets/sounds/collect/crystal.wav")
     _ITEM = ItemID.CRYSTAL
     _MIN_COLOR_CHANGE_INTERVAL: int = 10
     _MAX_COLOR_CHANGE_INTERVAL: int = 18
@@ -54,13 +55,15 @@ class Crystal(Ore):
         colex.ANTIQUE_WHITE,
         colex.PINK,
     ]
+    TICK_TIER = TickTier.INTERVAL
+    TICK_INTERVAL = 2
     color = colex.PURPLE
     texture = ["<*."]
     _color_change_cooldown: int = 0
     _shine_cooldown: int = 0
 
-    def update(self, _delta: float) -> None:
-        self._color_change_cooldown -= 1
+    def tick(self, elapsed: int) -> None:
+        self._color_change_cooldown -= elapsed
         if self._color_change_cooldown <= 0:
             self._color_change_cooldown = random.randint(
                 self._MIN_COLOR_CHANGE_INTERVAL,
@@ -68,7 +71,7 @@ class Crystal(Ore):
             )
             self.color = random.choice(self._COLORS)
 
-        self._shine_cooldown -= 1
+        self._shine_cooldown -= elapsed
         if self._shine_cooldown <= 0:
             self._shine_cooldown = random.randint(
                 self._MIN_SHINE_INTERVAL,
@@ -79,7 +82,7 @@ class Crystal(Ore):
 
 
 class Diamond(Ore):
-    _SOUND_COLLECT = pygame.mixer.Sound("assets/sounds/collect/diamond.wav")
+    _SOUND_COLLECT = audio.load("assets/sounds/collect/diamond.wav")
     _ITEM = ItemID.DIAMOND
     color = colex.SKY_BLUE
     texture = ["▒▓▒"]
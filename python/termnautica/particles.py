@@ -4,25 +4,20 @@ from typing import TYPE_CHECKING
 
 import colex
 from colex import ColorValue
-from charz import Sprite, AnimatedSprite, AnimationSet, Animation, Vec2, text
+from charz import Sprite, Vec2
 
+from .animation import ClockAnimated, with_mirrored
+from .assets import load_animation
 from .utils import randf
+from .lazy import lazy_import
 
-# Type checking for lazy loading
 if TYPE_CHECKING:
-    from .ocean import Water
+    from . import ocean
 else:
-    Water = None
+    ocean = lazy_import(".ocean", __package__)  # Import cycle
 
 
-def _ensure_ocean_water() -> None:
-    # Lazy loading - A quick workaround
-    global Water
-    if Water is None:
-        from .ocean import Water
-
-
-class Bubble(AnimatedSprite):
+class Bubble(ClockAnimated, Sprite):
     _FLOAT_SPEED: float = 0.5
     _COLORS: list[ColorValue] = [
         colex.AQUA,
@@ -30,35 +25,30 @@ class Bubble(AnimatedSprite):
         colex.ANTIQUE_WHITE,
     ]
     centered = True
-    animations = AnimationSet(
-        Float=Animation("bubble/float"),
-        Pop=Animation("bubble/pop"),
-    )
-    is_playing = True
-    current_animation = animations.Float
-    texture = current_animation.frames[0]
+    frame_sets = {
+        "Float": (tuple(load_animation("bubble/float").frames),),
+        "Pop": with_mirrored(load_animation("bubble/pop")),
+    }
+    animation = "Float"
+    repeat = True
+    texture = frame_sets["Float"][0][0]
 
     def __init__(self) -> None:
-        if random.randint(0, 1):
-            self.animations.Pop.frames = list(
-                map(text.flip_lines_h, self.animations.Pop.frames)
-            )
+        self.variant = random.randint(0, 1)  # Mirrored pop for variant 1
 
     def is_submerged(self) -> bool:
-        _ensure_ocean_water()
         self_height = self.global_position.y - self.texture_size.y / 2
-        wave_height = Water.wave_height_at(self.global_position.x)
+        wave_height = ocean.Water.wave_height_at(self.global_position.x)
         return self_height - wave_height > 0
 
     def update(self, _delta: float) -> None:
         self.color = random.choice(self._COLORS)
         self.position.y -= self._FLOAT_SPEED
-        if not self.is_submerged() and self.current_animation != self.animations.Pop:
+        self.update_visibility()
+        if not self.is_submerged() and self.animation != "Pop":
             self.play("Pop")
-        elif self.current_animation == self.animations.Pop:
+        elif self.animation == "Pop":
             self.queue_free()
-        elif not self.is_playing:
-            self.play("Float")
 
 
 class Particle(Sprite):
@@ -2,31 +2,33 @@ from math import floor
 from typing import assert_never
 
 import colex
-import keyboard
-from charz import Camera, Sprite, Collider, Hitbox, Vec2
+from charz import Camera, Sprite, Hitbox, Vec2
 
-from . import ui, ocean
+from . import ui, ocean, controls, recipe
+from .controls import ARROW_UP, ARROW_DOWN
 from .props import Collectable, Interactable, Building
 from .fabrication import Fabrication
 from .particles import Bubble, Blood
 from .item import ItemID, Stat, stats
+from .inventory import Inventory
+from .gametime import GameTime, ScheduledEvent
+from .registry import Registered
+from .collision import BroadphaseCollider, texture_mask
+from .transforms import CachedTransform
 from .utils import move_toward
 
 
-type Action = str | int
+type Action = controls.Key
 type Count = int
 
 
-ARROW_UP: int = 72
-ARROW_DOWN: int = 80
-
-
-class Player(Collider, Sprite):
+class Player(Registered, BroadphaseCollider, CachedTransform, Sprite):
     _GRAVITY: float = 0.91
     _JUMP_STRENGTH: float = 4
     _AIR_FRICTION: float = 0.7
     _WATER_FRICTION: float = 0.3
     _MAX_SPEED: Vec2 = Vec2(2, 2)
+    _DRAIN_RATE: float = -1 / 16  # Per frame, of oxygen, hunger and thirst
     _ACTIONS: tuple[Action, ...] = (  # Order is also precedence - First is highest
         ARROW_UP,  # NOTE: These 2 constants has to be checked before numeric strings
         ARROW_DOWN,
@@ -39,6 +41,7 @@ class Player(Collider, Sprite):
         "enter",
         "j",
         "k",
+        "c",
     )
     position = Vec2(17, -18)
     hitbox = Hitbox(size=Vec2(5, 3), centered=True)
@@ -51,18 +54,29 @@ class Player(Collider, Sprite):
         "/ | \\",
         " / \\",
     ]
+    # Whole bounding box of texture collides with ocean floor
+    _FLOOR_MASK = texture_mask(texture)
     _y_speed: float = 0
     _current_action: Action | None = None
     _key_just_pressed: bool = False
     _current_interactable: Sprite | None = None
 
     def __init__(self) -> None:
-        self.inventory = dict[ItemID, Count]()
+        self.inventory = Inventory()
+        self.craftability = recipe.CraftabilityIndex(recipe.graph(), self.inventory)
         # NOTE: Current `Camera` has to be initialized before `Player.__init__` is called
         self._health_bar = ui.HealthBar(Camera.current)
         self._oxygen_bar = ui.OxygenBar(Camera.current)
         self._hunger_bar = ui.HungerBar(Camera.current)
         self._thirst_bar = ui.ThirstBar(Camera.current)
+        # Survival stats change by rate, and act when their cells change
+        self._starvation_events: dict[ui.InfoBar, ScheduledEvent] = {}
+        self._oxygen_bar.subscribe(self.on_oxygen_change)
+        self.watch_starvation(self._oxygen_bar, delay=1)
+        self.watch_starvation(self._hunger_bar, delay=0)
+        self.watch_starvation(self._thirst_bar, delay=0)
+        self._hunger_bar.rate = self._DRAIN_RATE
+        self._thirst_bar.rate = self._DRAIN_RATE
         ui.Inventory(Camera.current, inventory_ref=self.inventory)
         ui.HotbarE(Camera.current)
         ui.Hotbar1(Camera.current)
@@ -87,8 +101,6 @@ class Player(Collider, Sprite):
         self.handle_interact()
         self.handle_collect()
         self.handle_oxygen()
-        self.handle_hunger()
-        self.handle_thirst()
         # NOTE: Order of drinking, eating and healing is not visually correct
         self.handle_eating()
         self.handle_drinking()
@@ -98,17 +110,7 @@ class Player(Collider, Sprite):
             self.on_death()
 
     def consume_item(self, item: ItemID, count: Count = 1) -> None:
-        if item not in self.inventory:
-            raise KeyError(
-                f"Attempted removing {count} {item.name},"
-                f" but {item.name} is not found in {self.inventory}"
-            )
-        elif count > self.inventory[item]:
-            raise ValueError(
-                f"Attempted to remove {count} {item.name},"
-                f" but only has {self.inventory[item]} in {self.inventory}"
-            )
-        self.inventory[item] -= count
+        self.inventory.remove(item, count)
 
         for stat in Stat:
             if stat not in stats[item]:
@@ -165,33 +167,33 @@ class Player(Collider, Sprite):
     def is_in_building(self) -> bool:
         return isinstance(self.parent, Building)
 
-    def is_colliding_with_ocean_floor(self) -> bool:
-        # FIXME: Find out why it says `int | float` and not just `int` for `<Vec2i>.x`
-        center = self.global_position
+    def texture_origin(self) -> Vec2:
+        # Global location of upper-left corner of texture
+        origin = self.global_position
         if self.centered:
-            center -= self.texture_size / 2
-        for x_offset in range(int(self.texture_size.x)):
-            for y_offset in range(int(self.texture_size.y)):
-                global_point = (
-                    floor(center.x + x_offset),
-                    floor(center.y + y_offset),
-                )
-                if global_point in ocean.Floor.points:
-                    return True
-        return False
+            origin -= self.texture_size / 2
+        return origin
+
+    def is_colliding_with_ocean_floor(self) -> bool:
+        origin = self.texture_origin()
+        return ocean.Floor.grid.overlaps(
+            self._FLOOR_MASK,
+            floor(origin.x),
+            floor(origin.y),
+        )
 
     def handle_action_input(self) -> None:
         if self._current_action is None:
             # Check for pressed
             for action in self._ACTIONS:
-                if keyboard.is_pressed(action):
+                if controls.is_pressed(action):
                     self._current_action = action
                     self._key_just_pressed = True
                     break
         elif self._key_just_pressed:
             # Deactivate "bool signal" after 1 single frame
             self._key_just_pressed = False
-        elif not keyboard.is_pressed(self._current_action):
+        elif not controls.is_pressed(self._current_action):
             # Release
             self._current_action = None
 
@@ -203,15 +205,21 @@ class Player(Collider, Sprite):
         if (
             self._current_action == "j"
             or self._current_action == ARROW_DOWN
-            or (self._current_action == "tab" and not keyboard.is_pressed("shift"))
+            or (self._current_action == "tab" and not controls.is_pressed("shift"))
         ):
             self._current_interactable.attempt_select_next_recipe()
         elif (
             self._current_action == "k"
             or self._current_action == ARROW_UP
-            or (self._current_action == "tab" and keyboard.is_pressed("shift"))
+            or (self._current_action == "tab" and controls.is_pressed("shift"))
         ):
             self._current_interactable.attempt_select_previous_recipe()
+        elif self._current_action == "c":
+            # Craft selected recipe, and missing intermediates - As many as possible with shift
+            self._current_interactable.craft_batch_by_index(
+                self.craftability,
+                all_possible=controls.is_pressed("shift"),
+            )
 
     def handle_movement_in_building(self, velocity: Vec2) -> None:
         assert isinstance(self.parent, Building)
@@ -223,13 +231,14 @@ class Player(Collider, Sprite):
             self._MAX_SPEED,
         )
         self.parent.move_and_collide_inside(self, combined_velocity)
+        self.update_broadphase()
         # Apply friction
         self._y_speed = move_toward(self._y_speed, 0, self._AIR_FRICTION)
 
     def handle_movement(self) -> None:
         velocity = Vec2(
-            keyboard.is_pressed("d") - keyboard.is_pressed("a"),
-            keyboard.is_pressed("s") - keyboard.is_pressed("w"),
+            controls.is_pressed("d") - controls.is_pressed("a"),
+            controls.is_pressed("s") - controls.is_pressed("w"),
         )
         # Is in builindg movement
         if self.is_in_building():
@@ -244,75 +253,95 @@ class Player(Collider, Sprite):
             self._MAX_SPEED,
         )
         # NOTE: Order of x/y matter
-        self.position.y += combined_velocity.y
+        origin = self.texture_origin()
+        (_hit_floor, allowed) = ocean.Floor.grid.resolve_motion(
+            self._FLOOR_MASK,
+            origin,
+            combined_velocity,
+        )
+        self.position.y += allowed.y
         # Revert motion if ended up colliding
-        if self.is_colliding_with_ocean_floor() or self.is_colliding():
-            self.position.y -= combined_velocity.y
+        if self.is_colliding():
+            self.position.y -= allowed.y
+            # X-axis motion was resolved as if Y-axis motion happened
+            (_hit_floor, allowed) = ocean.Floor.grid.resolve_motion(
+                self._FLOOR_MASK,
+                origin,
+                Vec2(combined_velocity.x, 0),
+            )
+        if allowed.y != combined_velocity.y:
             self._y_speed = 0  # Hit ocean floor
-        self.position.x += combined_velocity.x
+        self.position.x += allowed.x
         # Revert motion if ended up colliding
-        if self.is_colliding_with_ocean_floor() or self.is_colliding():
-            self.position.x -= combined_velocity.x
+        if self.is_colliding():
+            self.position.x -= allowed.x
+        self.update_broadphase()
         # Apply friction
         friction = self._WATER_FRICTION if self.is_submerged() else self._AIR_FRICTION
         self._y_speed = move_toward(self._y_speed, 0, friction)
 
     def handle_oxygen(self) -> None:
-        # Restore oxygen if inside a building with O2
+        # Restore oxygen if inside a building with O2, or above ocean waves
         if (  # Is in building with oxygen
             isinstance(self.parent, Building) and self.parent.HAS_OXYGEN
-        ):
-            self._oxygen_bar.fill()
-            return
-        # Restore oxygen if above ocean waves
-        if not self.is_submerged():
+        ) or not self.is_submerged():
+            if self._oxygen_bar.rate != 0:
+                self._oxygen_bar.rate = 0
             if self._oxygen_bar.value != self._oxygen_bar.MAX_VALUE:
                 self._oxygen_bar.fill()
             return
-        # Decrease health if no oxygen, and spawn particles each tick
-        if self._oxygen_bar.value == 0:
-            self._health_bar.value -= 1
-            Blood().with_global_position(
-                x=self.global_position.x - 1,
-                y=self.global_position.y - 1,
-            )
-            return
-        # Decrease oxygen
-        self._oxygen_bar.value -= 1 / 16
-        raw_count = self._oxygen_bar.MAX_VALUE / self._oxygen_bar.MAX_CELL_COUNT
-        # NOTE: Might be fragile logic, but works at least when
-        #       MAX_VALUE = 300 and MAX_CELL_COUNT = 10
-        if self._oxygen_bar.value % raw_count == 0:
+        # Decrease oxygen - Bubbles and damage are handled when cells change
+        if self._oxygen_bar.rate == 0:
+            self._oxygen_bar.rate = self._DRAIN_RATE
+            self._oxygen_bar.value += self._DRAIN_RATE  # Also used this frame
+
+    def on_oxygen_change(self, _change: float, cells_changed: int) -> None:
+        # Bubble for each cell of oxygen used
+        if cells_changed < 0:
             Bubble().with_global_position(
                 x=self.global_position.x,
                 y=self.global_position.y - 1,
             )
 
-    def handle_hunger(self) -> None:
-        self._hunger_bar.value -= 1 / 16
-        if self._hunger_bar.value == 0:
-            self._health_bar.value -= 1
-            Blood().with_global_position(
-                x=self.global_position.x - 1,
-                y=self.global_position.y - 1,
-            )
+    def watch_starvation(self, bar: ui.InfoBar, *, delay: int) -> None:
+        # Take damage every frame while bar is empty, starting `delay` frames after
+        def on_change(_change: float, cells_changed: int) -> None:
+            if (
+                cells_changed < 0
+                and bar.cell_count == 0
+                and bar not in self._starvation_events
+            ):
+                self._starvation_events[bar] = GameTime.schedule(
+                    GameTime.frame + delay,
+                    lambda: self.starve(bar),
+                )
 
-    def handle_thirst(self) -> None:
-        self._thirst_bar.value -= 1 / 16
-        if self._thirst_bar.value == 0:
-            self._health_bar.value -= 1
-            Blood().with_global_position(
-                x=self.global_position.x - 1,
-                y=self.global_position.y - 1,
-            )
+        bar.subscribe(on_change)
+
+    def starve(self, bar: ui.InfoBar) -> None:
+        if bar.value != 0:  # Refilled
+            del self._starvation_events[bar]
+            return
+        self._health_bar.value -= 1
+        Blood().with_global_position(
+            x=self.global_position.x - 1,
+            y=self.global_position.y - 1,
+        )
+        self._starvation_events[bar] = GameTime.schedule(
+            GameTime.frame + 1,
+            lambda: self.starve(bar),
+        )
 
     def handle_interact_selection(self) -> None:
         proximite_interactables: list[tuple[float, Interactable]] = []
         global_point = self.global_position  # Store property value outside loop
-        for node in Sprite.texture_instances.values():
+        for node in Interactable.spatial_hash.query(
+            global_point,
+            Interactable.max_reach_extent,
+        ):
+            assert isinstance(node, Interactable)
             if (
-                isinstance(node, Interactable)
-                and node.interactable
+                node.interactable
                 and (condition_and_dist := node.is_in_range_of(global_point))[0]
             ):  # I know this syntax might be a bit too much,
                 # but know that it made it easier to split logic into mixin class
@@ -320,7 +349,8 @@ class Player(Collider, Sprite):
 
         # Highlight closest interactable - Using DSU
         if proximite_interactables:
-            proximite_interactables.sort(key=lambda pair: pair[0])
+            # Ties are broken by creation order
+            proximite_interactables.sort(key=lambda pair: (pair[0], pair[1].uid))
             # Allow this because `Interactable` should always be used with `Sprite`
             if isinstance(self._current_interactable, Interactable):
                 # Reset color to class color
@@ -376,3 +406,10 @@ class Player(Collider, Sprite):
         self._current_interactable = None
         self._current_action = None
         self._key_just_pressed = False
+        # Stop survival stats
+        for event in self._starvation_events.values():
+            event.cancel()
+        self._starvation_events.clear()
+        self._oxygen_bar.rate = 0
+        self._hunger_bar.rate = 0
+        self._thirst_bar.rate = 0
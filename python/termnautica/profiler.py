@@ -0,0 +1,102 @@
+"""Frame timing, shown by the overlay toggled with F3.
+
+A frame is split into phases, marked from `App.update` and `GameScreen`:
+    update (`App.update` and every node) | render (`render_all`) | write (terminal)
+Nothing is measured while disabled, so each mark costs one check.
+"""
+
+import time
+from collections import deque
+from typing import ClassVar
+
+from charz import Node
+
+
+_SPARK_CHARS: str = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values: list[float]) -> str:
+    """Draw values as a line of bars, scaled to the largest value
+
+    Args:
+        values (list[float]): values to draw, one bar each
+
+    Returns:
+        str: line of bars
+    """
+    highest = max(values, default=0)
+    if highest <= 0:
+        return _SPARK_CHARS[0] * len(values)
+    last_index = len(_SPARK_CHARS) - 1
+    return "".join(
+        _SPARK_CHARS[round(value / highest * last_index)] for value in values
+    )
+
+
+class FrameProfiler:
+    HISTORY_SIZE: ClassVar[int] = 32  # Frames kept for sparkline
+    _SMOOTHING: ClassVar[float] = 0.1  # Weight of newest frame, in moving averages
+    is_enabled: ClassVar[bool] = False
+    frame_times: ClassVar[deque[float]] = deque(maxlen=HISTORY_SIZE)  # Seconds
+    # Moving averages
+    frame_time: ClassVar[float] = 0
+    update_time: ClassVar[float] = 0
+    render_time: ClassVar[float] = 0
+    write_time: ClassVar[float] = 0
+    output_bytes: ClassVar[float] = 0
+    node_count: ClassVar[int] = 0
+    _frame_start: ClassVar[float | None] = None
+    _render_start: ClassVar[float] = 0
+    _write_start: ClassVar[float] = 0
+
+    @classmethod
+    def toggle(cls) -> None:
+        cls.is_enabled = not cls.is_enabled
+        cls._frame_start = None
+        cls.frame_times.clear()
+
+    @classmethod
+    def begin_frame(cls) -> None:  # Call from `App.update`
+        if not cls.is_enabled:
+            return
+        now = time.perf_counter()
+        if cls._frame_start is not None:
+            frame_time = now - cls._frame_start
+            cls.frame_times.append(frame_time)
+            cls.frame_time = cls._smooth(cls.frame_time, frame_time)
+        cls._frame_start = now
+        cls.node_count = len(Node.node_instances)
+
+    @classmethod
+    def begin_render(cls) -> None:
+        if not cls.is_enabled or cls._frame_start is None:
+            return
+        cls._render_start = time.perf_counter()
+        cls.update_time = cls._smooth(
+            cls.update_time,
+            cls._render_start - cls._frame_start,
+        )
+
+    @classmethod
+    def begin_write(cls) -> None:
+        if not cls.is_enabled or cls._frame_start is None:
+            return
+        cls._write_start = time.perf_counter()
+        cls.render_time = cls._smooth(
+            cls.render_time,
+            cls._write_start - cls._render_start,
+        )
+
+    @classmethod
+    def end_write(cls, out: str) -> None:
+        if not cls.is_enabled or cls._frame_start is None:
+            return
+        cls.write_time = cls._smooth(
+            cls.write_time,
+            time.perf_counter() - cls._write_start,
+        )
+        cls.output_bytes = cls._smooth(cls.output_bytes, len(out.encode("utf-8")))
+
+    @classmethod
+    def _smooth(cls, average: float, value: float) -> float:
+        return average + (value - average) * cls._SMOOTHING
@@ -5,43 +5,67 @@ Classes defined here will be used as `mixin components`.
 They may also provide methods, either to be overwritten, or as base case.
 """
 
-from typing import Self
+from typing import Any, Self, ClassVar
 
-import pygame
 import colex
 from charz import Sprite, Hitbox, Vec2, clamp
 
+from . import audio
 from .item import ItemID, Recipe
+from .inventory import Inventory
+from .spatial import SpatialHash
+from .registry import Registered
 
 
-type Count = int
-
-
-class Collectable:
+class Collectable(Registered):
     _ITEM: ItemID
-    _SOUND_COLLECT: pygame.mixer.Sound | None = pygame.mixer.Sound(
+    _SOUND_COLLECT: audio.LazySound | None = audio.load(
         "assets/sounds/collect/default.wav"
     )
 
-    def collect_into(self, inventory: dict[ItemID, Count]) -> None:
+    def collect_into(self, inventory: Inventory) -> None:
         assert self._ITEM is not None, f"{self}.name is `None`"
 
-        if self._ITEM in inventory:
-            inventory[self._ITEM] += 1
-        else:
-            inventory[self._ITEM] = 1
+        inventory.add(self._ITEM)
 
         if self._SOUND_COLLECT is not None:
-            self._SOUND_COLLECT.play()
+            assert isinstance(self, Sprite), f"`Sprite` base missing for {self}"
+            self._SOUND_COLLECT.play(position=self.global_position)
 
 
-class Interactable:
+class Interactable(Registered):
     _REACH: float = 8  # Maximum length the interactor can be from the `Interactable`
     _REACH_FRACTION: float = 2 / 3  # Y-axis fraction, in linear transformation
     _REACH_CENTER: Vec2 = Vec2.ZERO  # Offset
     _HIGHLIGHT_Z_INDEX: int | None = None
     interactable: bool = True  # Turn off when in use
     _last_z_index: int | None = None
+    # Used for finding interactables near the interactor, without scanning every node
+    spatial_hash: ClassVar[SpatialHash[Sprite]] = SpatialHash(cell_size=16)
+    max_reach_extent: ClassVar[float] = 0  # Of any `Interactable` created so far
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        instance = super().__new__(cls, *args, **kwargs)
+        assert isinstance(instance, Sprite), f"`Sprite` base missing for {instance}"
+        Interactable.spatial_hash.insert(instance)
+        Interactable.max_reach_extent = max(
+            Interactable.max_reach_extent,
+            cls.reach_extent(),
+        )
+        return instance
+
+    @classmethod
+    def reach_extent(cls) -> float:
+        # Furthest an interactor can be from the origin along any axis, and still reach
+        return cls._REACH * max(1, cls._REACH_FRACTION) + max(
+            abs(cls._REACH_CENTER.x),
+            abs(cls._REACH_CENTER.y),
+        )
+
+    # NOTE: Call after moving, so `Interactable.spatial_hash` stays up to date
+    def update_spatial_hash(self) -> None:
+        assert isinstance(self, Sprite)
+        Interactable.spatial_hash.move(self)
 
     def with_interacting(self, state: bool, /) -> Self:
         self.interactable = state
@@ -80,8 +104,13 @@ class Interactable:
     # NOTE: Only triggered one time
     def on_deselect(self, actor: Sprite) -> None: ...
 
+    def _free(self) -> None:
+        assert isinstance(self, Sprite)
+        Interactable.spatial_hash.remove(self)
+        super()._free()  # type: ignore
+
 
-class Building:
+class Building(Registered):
     HAS_OXYGEN: bool = True
     _BOUNDARY: Hitbox | None = None
     _OPEN_CEILING: bool = False
@@ -115,47 +144,39 @@ class Building:
 class Crafting:
     _RECIPES: list[Recipe] = []  # NOTE: Order matter
 
-    def can_craft(self, recipe: Recipe, inventory: dict[ItemID, Count]) -> bool:
+    def can_craft(self, recipe: Recipe, inventory: Inventory) -> bool:
         return all(
-            inventory.get(idgredient, 0) >= idgredient_cost
+            inventory.get_count(idgredient) >= idgredient_cost
             for idgredient, idgredient_cost in recipe.idgredients.items()
         )
 
     def consume_idgredients(
         self,
         recipe: Recipe,
-        inventory: dict[ItemID, Count],
+        inventory: Inventory,
     ) -> None:
         for idgredient, idgredient_cost in recipe.idgredients.items():
-            if idgredient not in inventory:
-                raise KeyError(
-                    f"Attempted removing {idgredient_cost}x{idgredient},"
-                    f" but {idgredient} is not found in {inventory}"
-                )
-            inventory[idgredient] -= idgredient_cost
+            inventory.remove(idgredient, idgredient_cost)
 
     def add_products(
         self,
         recipe: Recipe,
-        inventory: dict[ItemID, Count],
+        inventory: Inventory,
     ) -> None:
         for product, production_count in recipe.products.items():
-            if product in inventory:
-                inventory[product] += production_count
-            else:
-                inventory[product] = production_count
+            inventory.add(product, production_count)
 
     def craft(
         self,
         recipe: Recipe,
-        inventory: dict[ItemID, Count],
+        inventory: Inventory,
     ) -> None:
         self.consume_idgredients(recipe, inventory)
         self.add_products(recipe, inventory)
 
     # def craft_each_if_possible(
     #     self,
-    #     inventory: dict[ItemID, Count],
+    #     inventory: Inventory,
     # ) -> None:
     #     for recipe in self._RECIPES:
     #         if self.can_craft(recipe, inventory):
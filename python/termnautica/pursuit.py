@@ -0,0 +1,102 @@
+"""Flow field, for steering many hunters toward one target.
+
+The field is a breadth first search over the terrain grid, outward from the target.
+Each reached cell stores its step distance to the target,
+and the direction of the next step along the shortest path.
+Hunters share one field, and look up their direction in O(1),
+so the cost does not grow with the number of hunters.
+"""
+
+from collections import deque
+from math import floor, sqrt
+from typing import Callable
+
+from charz import Vec2
+
+from .gametime import GameTime
+
+
+type Coordinate = tuple[int, int]
+
+
+_DIAGONAL: float = 1 / sqrt(2)
+# Neighbour offset, and normalized direction *from* that neighbour back to the cell
+_NEIGHBOURS: tuple[tuple[Coordinate, Vec2], ...] = (
+    ((1, 0), Vec2(-1, 0)),
+    ((-1, 0), Vec2(1, 0)),
+    ((0, 1), Vec2(0, -1)),
+    ((0, -1), Vec2(0, 1)),
+    ((1, 1), Vec2(-_DIAGONAL, -_DIAGONAL)),
+    ((-1, 1), Vec2(_DIAGONAL, -_DIAGONAL)),
+    ((1, -1), Vec2(-_DIAGONAL, _DIAGONAL)),
+    ((-1, -1), Vec2(_DIAGONAL, _DIAGONAL)),
+)
+
+
+class FlowField:
+    def __init__(self, radius: int, refresh_interval: int) -> None:
+        self.radius = radius  # In steps, along any axis
+        self.refresh_interval = refresh_interval  # Frames
+        self._last_refresh_frame: int | None = None
+        self._distances: dict[Coordinate, int] = {}
+        self._directions: dict[Coordinate, Vec2] = {}
+
+    @staticmethod
+    def snap(point: Vec2) -> Coordinate:
+        return (floor(point.x), floor(point.y))
+
+    def is_due(self) -> bool:
+        return (
+            self._last_refresh_frame is None
+            or GameTime.frame - self._last_refresh_frame >= self.refresh_interval
+        )
+
+    def refresh(
+        self,
+        target: Vec2,
+        is_blocked: Callable[[Coordinate], bool],
+    ) -> None:
+        """Recompute field around target, if it is due
+
+        Can be called by every hunter each frame,
+        since the field is recomputed at most once per `refresh_interval` frames.
+
+        Args:
+            target (Vec2): global point to flow toward
+            is_blocked (Callable[[Coordinate], bool]): whether a cell can't be passed
+        """
+        if not self.is_due():
+            return
+        self._last_refresh_frame = GameTime.frame
+        origin = self.snap(target)
+        distances = {origin: 0}
+        directions = {origin: Vec2.ZERO}
+        queue = deque((origin,))
+        (origin_x, origin_y) = origin
+        while queue:
+            cell = queue.popleft()
+            next_distance = distances[cell] + 1
+            for (offset_x, offset_y), direction in _NEIGHBOURS:
+                neighbour = (cell[0] + offset_x, cell[1] + offset_y)
+                if neighbour in distances:
+                    continue
+                if (
+                    abs(neighbour[0] - origin_x) > self.radius
+                    or abs(neighbour[1] - origin_y) > self.radius
+                ):
+                    continue
+                if is_blocked(neighbour):
+                    continue
+                distances[neighbour] = next_distance
+                directions[neighbour] = direction
+                queue.append(neighbour)
+        self._distances = distances
+        self._directions = directions
+
+    def distance_at(self, point: Vec2) -> int | None:
+        # `None` if out of radius, or not reachable from the target
+        return self._distances.get(self.snap(point))
+
+    def direction_at(self, point: Vec2) -> Vec2:
+        # NOTE: Shared vector, do not mutate
+        return self._directions.get(self.snap(point), Vec2.ZERO)
@@ -0,0 +1,206 @@
+"""Recipes of every fabrication building, compiled into one dependency graph.
+
+`RecipeGraph` knows which recipe produces each item, and orders recipes
+so that ingredients come before what they are used in. From that, it plans
+how to craft a recipe `N` times from an inventory, crafting missing
+intermediates first, like `STRING` (from `FABRIC`, from `KELP`) for a `MEDKIT`.
+
+`CraftabilityIndex` keeps the maximum craftable count of each recipe,
+and only recomputes recipes that depend on an item after that item changed
+in the inventory.
+"""
+
+from math import ceil
+from collections import defaultdict
+from collections.abc import Iterable
+
+from .item import ItemID, Recipe
+from .inventory import Inventory
+
+
+type Count = int
+type Plan = list[tuple[Recipe, Count]]  # Steps, in order of crafting
+
+
+class RecipeGraph:
+    def __init__(self, recipes: Iterable[Recipe]) -> None:
+        # Index by identity, since `Recipe` holds dicts and is not hashable
+        self._producers: dict[ItemID, Recipe] = {}
+        unique: dict[int, Recipe] = {}
+        for recipe in recipes:
+            unique.setdefault(id(recipe), recipe)
+            for product in recipe.products:
+                # NOTE: First recipe found is used, if an item has several
+                self._producers.setdefault(product, recipe)
+        self.recipes = self._sorted(list(unique.values()))
+        self._order = {id(recipe): index for index, recipe in enumerate(self.recipes)}
+        # Recipes whose plan may read the count of item, directly or via intermediates
+        self._dependents: defaultdict[ItemID, list[Recipe]] = defaultdict(list)
+        for recipe in self.recipes:
+            for item in self._items_used_by(recipe):
+                self._dependents[item].append(recipe)
+
+    def _sorted(self, recipes: list[Recipe]) -> tuple[Recipe, ...]:
+        # Depth first, so producers of idgredients come first
+        ordered: list[Recipe] = []
+        visiting: set[int] = set()
+        visited: set[int] = set()
+
+        def visit(recipe: Recipe) -> None:
+            if id(recipe) in visited:
+                return
+            if id(recipe) in visiting:
+                raise ValueError(f"Recipe depends on its own products: {recipe}")
+            visiting.add(id(recipe))
+            for idgredient in recipe.idgredients:
+                if idgredient in self._producers:
+                    visit(self._producers[idgredient])
+            visiting.remove(id(recipe))
+            visited.add(id(recipe))
+            ordered.append(recipe)
+
+        for recipe in recipes:
+            visit(recipe)
+        return tuple(ordered)
+
+    def _items_used_by(self, recipe: Recipe) -> set[ItemID]:
+        items: set[ItemID] = set()
+        pending = [recipe]
+        while pending:
+            current = pending.pop()
+            for idgredient in current.idgredients:
+                if idgredient in items:
+                    continue
+                items.add(idgredient)
+                if idgredient in self._producers:
+                    pending.append(self._producers[idgredient])
+        return items
+
+    def dependents(self, item: ItemID) -> list[Recipe]:
+        return self._dependents.get(item, [])
+
+    def plan(self, recipe: Recipe, count: Count, inventory: Inventory) -> Plan | None:
+        """Plan crafting recipe `count` times, including missing intermediates
+
+        Args:
+            recipe (Recipe): recipe to craft
+            count (Count): times to craft it
+            inventory (Inventory): items available
+
+        Returns:
+            Plan | None: steps in order of crafting, or `None` if not enough items
+        """
+        crafts: dict[int, Count] = {id(recipe): count}
+        needed: defaultdict[ItemID, Count] = defaultdict(int)
+        # Products before idgredients, so every need is known when a recipe is reached
+        for current in reversed(self.recipes[: self._order[id(recipe)] + 1]):
+            if current is not recipe:
+                crafts[id(current)] = max(
+                    (
+                        ceil(
+                            max(0, needed[product] - inventory.get_count(product))
+                            / product_count
+                        )
+                        for product, product_count in current.products.items()
+                        if self._producers[product] is current
+                    ),
+                    default=0,
+                )
+            times = crafts[id(current)]
+            if times == 0:
+                continue
+            for idgredient, idgredient_cost in current.idgredients.items():
+                needed[idgredient] += idgredient_cost * times
+        # Crafted intermediates cover the rest, so only check the items consumed
+        for item, count_needed in needed.items():
+            produced = 0
+            if (producer := self._producers.get(item)) is not None:
+                produced = crafts.get(id(producer), 0) * producer.products[item]
+            if inventory.get_count(item) + produced < count_needed:
+                return None
+        return [
+            (current, crafts[id(current)])
+            for current in self.recipes
+            if crafts.get(id(current), 0) > 0
+        ]
+
+    def max_craftable(self, recipe: Recipe, inventory: Inventory) -> Count:
+        # Grow upper bound, then binary search, since a larger count never gets easier
+        if self.plan(recipe, 1, inventory) is None:
+            return 0
+        low = 1
+        high = 2
+        while self.plan(recipe, high, inventory) is not None:
+            low = high
+            high *= 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.plan(recipe, middle, inventory) is None:
+                high = middle
+            else:
+                low = middle
+        return low
+
+    def craft(self, recipe: Recipe, count: Count, inventory: Inventory) -> bool:
+        """Craft recipe `count` times, crafting missing intermediates first
+
+        Args:
+            recipe (Recipe): recipe to craft
+            count (Count): times to craft it
+            inventory (Inventory): items to use, and to put products in
+
+        Returns:
+            bool: whether it was crafted, nothing is changed if `False`
+        """
+        plan = self.plan(recipe, count, inventory)
+        if plan is None:
+            return False
+        for step, times in plan:
+            for idgredient, idgredient_cost in step.idgredients.items():
+                inventory.remove(idgredient, idgredient_cost * times)
+            for product, production_count in step.products.items():
+                inventory.add(product, production_count * times)
+        return True
+
+
+class CraftabilityIndex:
+    def __init__(self, graph: RecipeGraph, inventory: Inventory) -> None:
+        self.graph = graph
+        self.inventory = inventory
+        self._counts: dict[int, Count] = {}  # Missing when outdated
+        inventory.subscribe(self._on_item_changed)
+
+    def _on_item_changed(self, item: ItemID, _old: Count, _new: Count) -> None:
+        for recipe in self.graph.dependents(item):
+            self._counts.pop(id(recipe), None)
+
+    def max_craftable(self, recipe: Recipe) -> Count:
+        count = self._counts.get(id(recipe))
+        if count is None:
+            count = self.graph.max_craftable(recipe, self.inventory)
+            self._counts[id(recipe)] = count
+        return count
+
+    def craft(self, recipe: Recipe, count: Count) -> bool:
+        return self.graph.craft(recipe, count, self.inventory)
+
+
+_graph: RecipeGraph | None = None
+
+
+def graph() -> RecipeGraph:
+    # Compiled on first use, since buildings import this module through `Fabrication`
+    global _graph
+    if _graph is None:
+        from .buildings.basic_fabricator import BasicFabricator
+        from .buildings.smelter import Smelter
+        from .buildings.grill import Grill
+
+        _graph = RecipeGraph(
+            [
+                *BasicFabricator._RECIPES,
+                *Smelter._RECIPES,
+                *Grill._RECIPES,
+            ]
+        )
+    return _graph
@@ -0,0 +1,57 @@
+"""Live instances of game classes, kept up to date on node creation and free.
+
+Subclasses of `Registered` are indexed under every class in their mro
+that is itself a subclass of `Registered`. This makes both concrete classes,
+like `Player`, and mixin classes, like `Interactable`, look up their live
+instances in constant time, without scanning `Node.node_instances`.
+"""
+
+from collections import defaultdict
+from collections.abc import ValuesView
+from typing import Any, ClassVar, Self
+
+from charz import Node
+
+
+class Registered:  # Component (mixin class)
+    # NOTE: Classes defined later are added on first use, since `World` swaps this
+    _registries: ClassVar[defaultdict[type, dict[int, Any]]] = defaultdict(dict)
+    _registered_kinds: ClassVar[tuple[type, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._registered_kinds = tuple(
+            kind
+            for kind in cls.__mro__
+            if issubclass(kind, Registered) and kind is not Registered
+        )
+        for kind in cls._registered_kinds:
+            Registered._registries.setdefault(kind, {})
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        instance = super().__new__(cls, *args, **kwargs)
+        assert isinstance(instance, Node), f"`Node` base missing for {instance}"
+        for kind in cls._registered_kinds:
+            Registered._registries[kind][instance.uid] = instance
+        return instance
+
+    @classmethod
+    def instances(cls) -> ValuesView[Self]:
+        """Get live instances of this class, including instances of subclasses
+
+        `NOTE`: Returns a live view, iterate a copy if nodes are created meanwhile
+
+        Returns:
+            ValuesView[Self]: instances, in order of creation
+        """
+        return Registered._registries[cls].values()
+
+    @classmethod
+    def first_instance(cls) -> Self | None:
+        return next(iter(Registered._registries[cls].values()), None)
+
+    def _free(self) -> None:
+        assert isinstance(self, Node)
+        for kind in self._registered_kinds:
+            del Registered._registries[kind][self.uid]
+        super()._free()  # type: ignore
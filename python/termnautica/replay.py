@@ -0,0 +1,151 @@
+"""Recording of input per frame, and deterministic replay of it.
+
+The simulation is deterministic given the seed set in `termnautica`,
+and the key state of each frame. A recording stores the key mask of every frame
+(see `controls`), and a checksum of the game state every `CHECKSUM_INTERVAL` frames.
+Replaying feeds the masks back while running headless, as fast as possible,
+and compares the checksums, to confirm that gameplay did not change.
+
+Layout of recording file:
+    magic (4 bytes) | header (u32 x 4, little endian) | zlib(masks + checksums)
+where the header is: keys id, frame count, checksum interval, checksum count.
+"""
+
+import random
+import struct
+import sys
+import time
+import zlib
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from charz import Node
+
+from . import controls
+from .gametime import GameTime
+
+if TYPE_CHECKING:
+    from .app import App
+
+
+CHECKSUM_INTERVAL: int = 16
+_MAGIC: bytes = b"TNR1"
+_HEADER = struct.Struct("<4sIIII")
+# Recordings made with other keys can't be replayed
+_KEYS_ID: int = zlib.crc32(repr(controls.KEYS).encode("utf-8"))
+
+
+def state_checksum(app: "App") -> int:
+    """Checksum of the game state that depends on input
+
+    Args:
+        app (App): running app
+
+    Returns:
+        int: unsigned 32 bit checksum
+    """
+    player = app.player
+    state = (
+        GameTime.frame,
+        len(Node.node_instances),
+        player.global_position.to_tuple(),
+        player._y_speed,
+        player._health_bar.value,
+        player._oxygen_bar.value,
+        player._hunger_bar.value,
+        player._thirst_bar.value,
+        sorted((item.value, count) for item, count in player.inventory.items()),
+        hash(random.getstate()),  # Deterministic, since it only contains ints
+    )
+    return zlib.crc32(repr(state).encode("utf-8"))
+
+
+class Recording:
+    def __init__(self) -> None:
+        self.masks = array("I")  # Key mask of every frame
+        self.checksums = array("I")  # State before every `CHECKSUM_INTERVAL` frames
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def capture(self, app: "App", mask: controls.Mask) -> None:  # Call from `App.update`
+        if len(self.masks) % CHECKSUM_INTERVAL == 0:
+            self.checksums.append(state_checksum(app))
+        self.masks.append(mask)
+
+    def save(self, path: Path) -> None:
+        payload = zlib.compress(self.masks.tobytes() + self.checksums.tobytes(), 9)
+        header = _HEADER.pack(
+            _MAGIC,
+            _KEYS_ID,
+            len(self.masks),
+            CHECKSUM_INTERVAL,
+            len(self.checksums),
+        )
+        path.write_bytes(header + payload)
+
+    @classmethod
+    def load(cls, path: Path) -> "Recording":
+        data = path.read_bytes()
+        (magic, keys_id, frame_count, interval, checksum_count) = _HEADER.unpack_from(
+            data, 0
+        )
+        if magic != _MAGIC:
+            raise ValueError(f"Invalid recording file: {path}")
+        if keys_id != _KEYS_ID:
+            raise ValueError(f"Recording was made with other keys: {path}")
+        if interval != CHECKSUM_INTERVAL:
+            raise ValueError(f"Recording has checksum interval {interval}: {path}")
+        payload = zlib.decompress(data[_HEADER.size :])
+        recording = cls()
+        mask_size = frame_count * recording.masks.itemsize
+        recording.masks.frombytes(payload[:mask_size])
+        recording.checksums.frombytes(payload[mask_size:])
+        assert len(recording.checksums) == checksum_count, "Corrupt recording"
+        return recording
+
+
+def replay(path: Path) -> int:
+    """Replay recording headless, and report if gameplay diverged
+
+    Args:
+        path (Path): recording file, made with `termnautica --record`
+
+    Returns:
+        int: exit code, `0` if every checksum matched, `1` otherwise
+    """
+    expected = Recording.load(path)
+    masks = iter(expected.masks)
+    controls.set_source(lambda: next(masks, 0))
+
+    from .app import HeadlessApp
+
+    app = HeadlessApp()
+    app.recording = Recording()
+    app.is_running = True  # Cleared when "esc" is replayed
+    start = time.perf_counter()
+    for _ in range(len(expected)):
+        app.tick()
+        if not app.is_running:
+            break
+    elapsed = time.perf_counter() - start
+
+    actual = app.recording
+    frame_count = len(actual)
+    print(
+        f"Replayed {frame_count} frames in {elapsed:.2f}s"
+        f" ({frame_count / max(elapsed, 1e-9):.0f} frames/s)"
+    )
+    for index, (wanted, got) in enumerate(zip(expected.checksums, actual.checksums)):
+        if wanted != got:
+            print(
+                f"Diverged before frame {index * CHECKSUM_INTERVAL + 1}",
+                file=sys.stderr,
+            )
+            return 1
+    if len(actual.checksums) != len(expected.checksums):
+        print("Replay ended early", file=sys.stderr)
+        return 1
+    print(f"All {len(actual.checksums)} checksums matched")
+    return 0
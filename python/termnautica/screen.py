@@ -0,0 +1,20 @@
+from rust import RustScreen
+
+from .profiler import FrameProfiler
+from .spectate import SpectatorServer
+
+
+class GameScreen(RustScreen):
+    spectators: SpectatorServer | None = None  # Shown frames are published when set
+
+    # Marks render and write phases for `FrameProfiler`
+    def refresh(self) -> None:
+        FrameProfiler.begin_render()
+        super().refresh()
+
+    def show(self, out: str) -> None:
+        FrameProfiler.begin_write()
+        super().show(out)
+        FrameProfiler.end_write(out)
+        if self.spectators is not None:
+            self.spectators.publish(out)
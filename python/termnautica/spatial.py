@@ -0,0 +1,102 @@
+"""Uniform spatial hash, for finding nodes near a point without scanning the world.
+
+Nodes are bucketed by the grid cell of their global position.
+Insertion is deferred until the next query, since most nodes are positioned
+*after* being created (like `Spawner` does with `.with_global_position`).
+Nodes that move have to report it with `SpatialHash.move`,
+which only touches the buckets if the node crossed into another cell.
+"""
+
+from math import floor
+
+from charz import Node2D, Vec2
+
+
+type Cell = tuple[int, int]
+
+
+class SpatialHash[T: Node2D]:
+    def __init__(self, cell_size: int) -> None:
+        assert cell_size > 0, f"Cell size has to be positive, got: {cell_size}"
+        self.cell_size = cell_size
+        self._cells: dict[Cell, dict[int, T]] = {}
+        self._node_cells: dict[int, Cell] = {}  # Where each node is stored
+        self._pending: dict[int, T] = {}  # Not yet bucketed
+
+    def __len__(self) -> int:
+        return len(self._node_cells) + len(self._pending)
+
+    def __contains__(self, node: T) -> bool:
+        return node.uid in self._node_cells or node.uid in self._pending
+
+    def cell_of(self, point: Vec2) -> Cell:
+        return (
+            floor(point.x / self.cell_size),
+            floor(point.y / self.cell_size),
+        )
+
+    def insert(self, node: T) -> None:
+        self._pending[node.uid] = node
+
+    def remove(self, node: T) -> None:
+        if self._pending.pop(node.uid, None) is not None:
+            return
+        cell = self._node_cells.pop(node.uid, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        del bucket[node.uid]
+        if not bucket:
+            del self._cells[cell]
+
+    def move(self, node: T) -> None:
+        cell = self._node_cells.get(node.uid)
+        if cell is None:  # Pending nodes are bucketed on next query
+            return
+        new_cell = self.cell_of(node.global_position)
+        if new_cell == cell:
+            return
+        bucket = self._cells[cell]
+        del bucket[node.uid]
+        if not bucket:
+            del self._cells[cell]
+        self._bucket(node, new_cell)
+
+    def query(self, center: Vec2, radius: float) -> list[T]:
+        """Get nodes that *may* be within `radius` of `center`
+
+        Every node inside the square with half size `radius` is returned,
+        along with the other nodes sharing the cells that square overlaps.
+        Exact distance checks are left to the caller.
+
+        Args:
+            center (Vec2): global point to search around
+            radius (float): half size of the square to search
+
+        Returns:
+            list[T]: candidates, in no particular order
+        """
+        self._flush()
+        start = self.cell_of(Vec2(center.x - radius, center.y - radius))
+        end = self.cell_of(Vec2(center.x + radius, center.y + radius))
+        candidates: list[T] = []
+        for cell_x in range(start[0], end[0] + 1):
+            for cell_y in range(start[1], end[1] + 1):
+                bucket = self._cells.get((cell_x, cell_y))
+                if bucket:
+                    candidates.extend(bucket.values())
+        return candidates
+
+    def _bucket(self, node: T, cell: Cell) -> None:
+        self._node_cells[node.uid] = cell
+        if cell in self._cells:
+            self._cells[cell][node.uid] = node
+        else:
+            self._cells[cell] = {node.uid: node}
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        for node in self._pending.values():
+            self._bucket(node, self.cell_of(node.global_position))
+        self._pending.clear()
@@ -4,11 +4,12 @@ from types import UnionType, get_original_bases
 from typing import Any, Self, get_origin, get_args, assert_never
 
 import colex
-from charz import Sprite, Vec2
+from charz import Node, Sprite, Vec2
 
 from . import fish, ores, ocean
 from .kelp import Kelp
 from .particles import Bubble
+from .ticks import Ticked, TickTier
 
 
 class SpawnMode(Enum):
@@ -20,7 +21,8 @@ class SpawnMode(Enum):
 
 
 # TODO: Implement
-class Spawner[T: Sprite](Sprite):
+class Spawner[T: Sprite](Ticked, Sprite):
+    TICK_TIER = TickTier.BUDGETED
     _SPAWN_INTERVAL: int = 100
     _SPAWN_OFFSET: Vec2 = Vec2.ZERO
     _MAX_ACTIVE_SPAWNS: int = 1
@@ -29,7 +31,7 @@ class Spawner[T: Sprite](Sprite):
     color = colex.BLACK
     texture = ["<Unset Spawner Texture>"]
     _time_until_spawn: int = 0
-    _spawned_instances: list[T]  # TODO: Remove from list when freed
+    _spawned_instances: list[T]  # Freed instances are dropped when counting
 
     # Make unique in `__new__`, so `__init__` can be used to init spawner
     def __new__(cls, *args: Any, **kwargs: Any) -> Self:
@@ -41,16 +43,15 @@ class Spawner[T: Sprite](Sprite):
 
     def check_active_spawns_count(self) -> int:
         # NOTE: SIDE EFFECT: Remove from `_spawned_instances` if instance not alive
-        count = 0
-        for instance in self._spawned_instances:  # O(n) loop
-            if instance.uid in Sprite.texture_instances:  # O(1) lookup
-                count += 1
-            else:
-                self._spawned_instances.remove(instance)
-        return count
-
-    def update(self, _delta: float) -> None:
-        self._time_until_spawn -= 1
+        self._spawned_instances = [
+            instance
+            for instance in self._spawned_instances  # O(n) loop, n <= max spawns
+            if instance.uid in Node.node_instances  # O(1) lookup
+        ]
+        return len(self._spawned_instances)
+
+    def tick(self, elapsed: int) -> None:
+        self._time_until_spawn -= elapsed
         if self.check_active_spawns_count() < self._MAX_ACTIVE_SPAWNS:
             if self._time_until_spawn <= 0:
                 self._time_until_spawn = self._SPAWN_INTERVAL
@@ -118,11 +119,7 @@ class KelpSpawner(Spawner[Kelp]):
     texture = [",|."]
 
     def init_spawned(self, instance: Kelp) -> None:
-        assert instance.current_animation is not None, "Animation should have started"
-        instance._frame_index = random.randint(
-            0,
-            len(instance.current_animation.frames) - 1,
-        )
+        instance.set_phase(random.randint(0, len(instance.get_frames()) - 1))
 
 
 class OreSpawner(Spawner[ores.Gold | ores.Titanium | ores.Copper | ores.Coal]):
@@ -167,6 +164,9 @@ class FishSpawner(
 
 
 class BubbleSpawner(Spawner[Bubble]):
+    # Spawns too often to wait for its turn in budget
+    TICK_TIER = TickTier.INTERVAL
+    TICK_INTERVAL = 2
     _INITIAL_SPAWN = False
     _SPAWN_INTERVAL = 8
     _MAX_ACTIVE_SPAWNS = 2
@@ -0,0 +1,270 @@
+"""Spectators, watching a running session from other terminals.
+
+Started with `termnautica --spectate ADDRESS`, and watched with
+`termnautica watch ADDRESS`, where the address is either `HOST:PORT` (TCP),
+or a path (Unix socket).
+
+The game loop only hands each shown frame to `SpectatorServer.publish`,
+which keeps the newest one, and wakes the broadcast thread. That thread encodes
+the frame once, as the lines that changed since the previous frame (delta),
+and sends the same bytes to every client. A client that has not received
+everything sent before, skips deltas, and gets the whole frame (keyframe)
+once it has caught up, so slow clients never build a backlog.
+
+Layout of stream, sent to each client:
+    magic (4 bytes) | message...
+where each message is a header (u8 kind, u32 frame, u16 line count, u16 lines sent)
+followed by the lines sent, each as: u16 line index | u32 size | UTF-8 bytes.
+"""
+
+import os
+import sys
+import socket
+import select
+import struct
+import threading
+from dataclasses import dataclass, field
+
+from .gametime import GameTime
+
+
+type Address = tuple[int, str | tuple[str, int]]  # Socket family and address
+
+
+KEYFRAME: int = 0
+DELTA: int = 1
+_MAGIC: bytes = b"TNS1"
+_HEADER = struct.Struct("<BIHH")
+_LINE = struct.Struct("<HI")
+
+
+def parse_address(address: str) -> Address:
+    """Parse address given on command line
+
+    Args:
+        address (str): `HOST:PORT` for TCP, or path to Unix socket
+
+    Returns:
+        Address: socket family and address
+    """
+    (host, _, port) = address.rpartition(":")
+    if host and port.isdigit():
+        return (socket.AF_INET, (host, int(port)))
+    if not hasattr(socket, "AF_UNIX"):
+        raise ValueError(f"Unix sockets are not supported, use HOST:PORT: {address}")
+    return (socket.AF_UNIX, address)
+
+
+def encode(kind: int, frame: int, lines: list[str], indices: list[int]) -> bytes:
+    parts = [_HEADER.pack(kind, frame, len(lines), len(indices))]
+    for index in indices:
+        data = lines[index].encode("utf-8")
+        parts.append(_LINE.pack(index, len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+@dataclass(kw_only=True, slots=True)
+class _Client:
+    connection: socket.socket
+    outbox: bytearray = field(default_factory=bytearray)  # Not yet sent
+    needs_keyframe: bool = True
+
+
+class SpectatorServer:
+    def __init__(self, address: str) -> None:
+        (self.family, self.address) = parse_address(address)
+        self._clients: list[_Client] = []
+        self._frame: tuple[int, str] | None = None  # Newest published
+        self._lines: list[str] = []  # Of previous encoded frame
+        self._is_running = False
+        self._thread: threading.Thread | None = None
+        self._listener: socket.socket | None = None
+        (self._wake_reader, self._wake_writer) = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+
+    def start(self) -> None:
+        if self.family == socket.AF_UNIX:
+            assert isinstance(self.address, str)
+            if os.path.exists(self.address):  # Left by a previous session
+                os.unlink(self.address)
+        self._listener = socket.socket(self.family, socket.SOCK_STREAM)
+        if self.family == socket.AF_INET:
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(self.address)
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self._is_running = True
+        self._thread = threading.Thread(
+            target=self._broadcast_loop,
+            name="spectator-broadcast",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._is_running = False
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        for client in self._clients:
+            client.connection.close()
+        self._clients.clear()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            if self.family == socket.AF_UNIX:
+                assert isinstance(self.address, str)
+                os.unlink(self.address)
+        self._wake_reader.close()
+        self._wake_writer.close()
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def publish(self, out: str) -> None:  # Call from `GameScreen.show`
+        # NOTE: Runs on game thread, so only hands frame over, and only with clients
+        if not self._clients:
+            return
+        self._frame = (GameTime.frame, out)
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_writer.send(b"\x00")
+        except BlockingIOError:  # Already woken, and not yet handled
+            pass
+
+    def _broadcast_loop(self) -> None:
+        assert self._listener is not None
+        broadcasted: tuple[int, str] | None = None
+        while self._is_running:
+            waiting = [client.connection for client in self._clients if client.outbox]
+            (readable, writable, _) = select.select(
+                [self._listener, self._wake_reader],
+                waiting,
+                [],
+                1,
+            )
+            if self._listener in readable:
+                self._accept()
+            if self._wake_reader in readable:
+                try:
+                    while self._wake_reader.recv(4096):
+                        pass
+                except BlockingIOError:
+                    pass
+            frame = self._frame
+            if frame is not None and frame is not broadcasted:
+                self._broadcast(*frame)
+                broadcasted = frame
+            if writable:
+                for client in list(self._clients):
+                    if client.connection in writable:
+                        self._flush(client)
+
+    def _accept(self) -> None:
+        assert self._listener is not None
+        try:
+            (connection, _) = self._listener.accept()
+        except BlockingIOError:
+            return
+        connection.setblocking(False)
+        client = _Client(connection=connection, outbox=bytearray(_MAGIC))
+        self._clients.append(client)
+        self._flush(client)
+
+    def _broadcast(self, frame: int, out: str) -> None:
+        lines = out.split("\n")
+        previous = self._lines
+        if len(lines) == len(previous):
+            changed = [
+                index
+                for index, (line, old_line) in enumerate(zip(lines, previous))
+                if line != old_line
+            ]
+            delta = encode(DELTA, frame, lines, changed)
+        else:  # Resized, so every line changed
+            delta = encode(KEYFRAME, frame, lines, list(range(len(lines))))
+        self._lines = lines
+        keyframe: bytes | None = None  # Only encoded if a client needs it
+        for client in list(self._clients):
+            if client.outbox:  # Behind, so skip frame
+                client.needs_keyframe = True
+                continue
+            if client.needs_keyframe:
+                if keyframe is None:
+                    keyframe = encode(KEYFRAME, frame, lines, list(range(len(lines))))
+                client.outbox += keyframe
+                client.needs_keyframe = False
+            else:
+                client.outbox += delta
+            self._flush(client)
+
+    def _flush(self, client: _Client) -> None:
+        try:
+            sent = client.connection.send(client.outbox)
+        except BlockingIOError:
+            return
+        except OSError:  # Disconnected
+            client.connection.close()
+            self._clients.remove(client)
+            return
+        del client.outbox[:sent]
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            raise EOFError("Session ended")
+        data += chunk
+    return bytes(data)
+
+
+def watch(address: str) -> int:
+    """Show frames of a session, until it ends
+
+    Args:
+        address (str): address given to `termnautica --spectate`
+
+    Returns:
+        int: exit code, `0` when session ended, `1` if it could not be watched
+    """
+    (family, resolved) = parse_address(address)
+    connection = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        connection.connect(resolved)
+    except OSError as error:
+        print(f"Could not connect to {address}: {error}", file=sys.stderr)
+        return 1
+    out = sys.stdout
+    try:
+        if _receive_exactly(connection, len(_MAGIC)) != _MAGIC:
+            print(f"Not a spectator server: {address}", file=sys.stderr)
+            return 1
+        out.write("\x1b[?25l")  # Hide cursor
+        while True:
+            (kind, _frame, _line_count, sent_count) = _HEADER.unpack(
+                _receive_exactly(connection, _HEADER.size)
+            )
+            if kind == KEYFRAME:
+                out.write("\x1b[2J")
+            for _ in range(sent_count):
+                (index, size) = _LINE.unpack(_receive_exactly(connection, _LINE.size))
+                line = _receive_exactly(connection, size).decode("utf-8")
+                out.write(f"\x1b[{index + 1};1H{line}")
+            out.write("\x1b[0m")
+            out.flush()
+    except EOFError:
+        return 0
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        connection.close()
+        out.write("\x1b[0m\x1b[?25h\n")
+        out.flush()
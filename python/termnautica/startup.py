@@ -0,0 +1,54 @@
+"""Timing of startup, reported with `termnautica --profile-startup`.
+
+Times are measured from when `termnautica` is first imported.
+Phases may overlap, like asset loading, which mostly happens while importing.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from charz import Screen
+
+
+_START: float = time.perf_counter()
+_phases: dict[str, float] = {}  # Total seconds spent, by phase
+_marks: dict[str, float] = {}  # Seconds since start, by event
+
+
+def add(phase: str, seconds: float) -> None:
+    _phases[phase] = _phases.get(phase, 0) + seconds
+
+
+@contextmanager
+def measure(phase: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add(phase, time.perf_counter() - start)
+
+
+def mark(event: str) -> None:
+    _marks.setdefault(event, time.perf_counter() - _START)
+
+
+def mark_first_frame(screen: Screen) -> None:
+    # Marks "first frame" once `screen` has refreshed the first time
+    refresh = screen.refresh
+
+    def refresh_once() -> None:
+        refresh()
+        mark("first frame")
+        del screen.refresh  # Back to the method of the class
+
+    screen.refresh = refresh_once  # type: ignore[method-assign]
+
+
+def report() -> str:
+    lines = ["Startup profile:"]
+    for phase, seconds in _phases.items():
+        lines.append(f"  {phase:<16}{seconds * 1000:>9.1f} ms")
+    for event, seconds in sorted(_marks.items(), key=lambda item: item[1]):
+        lines.append(f"  {event + ' at':<16}{seconds * 1000:>9.1f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,126 @@
+"""Tick tiers, for nodes that don't need to update every frame.
+
+A node class opts in by using the `Ticked` component, and declaring a `TICK_TIER`:
+- `TickTier.FRAME`: ticked every frame.
+- `TickTier.INTERVAL`: ticked every `TICK_INTERVAL` frames. Instances are spread
+  over the frames of the interval, so they don't all tick on the same frame.
+- `TickTier.BUDGETED`: ticked in turn, `TickScheduler.budget` per frame, or more
+  when there are many, so each is ticked at least every `TickScheduler.max_period`
+  frames, no matter how large the world is.
+
+Instead of `update`, a ticked node gets `tick(elapsed)`, where `elapsed` is the
+number of frames since its last tick, so timers counted in frames stay correct.
+Nodes without `Ticked` are updated every frame, like before.
+"""
+
+from collections import deque
+from math import ceil
+from enum import Enum, auto
+from typing import Any, ClassVar, Self
+
+from charz import Node
+
+from .gametime import GameTime
+
+
+class TickTier(Enum):
+    FRAME = auto()
+    INTERVAL = auto()
+    BUDGETED = auto()
+
+
+class Ticked:  # Component (mixin class)
+    TICK_TIER: ClassVar[TickTier] = TickTier.INTERVAL
+    TICK_INTERVAL: ClassVar[int] = 4  # Frames, for `TickTier.INTERVAL`
+    _last_tick_frame: int = 0
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        instance = super().__new__(cls, *args, **kwargs)
+        assert isinstance(instance, Node), f"`Node` base missing for {instance}"
+        instance._last_tick_frame = GameTime.frame
+        TickScheduler.add(instance)
+        return instance
+
+    def tick(self, elapsed: int, /) -> None: ...
+
+    def _free(self) -> None:
+        TickScheduler.remove(self)
+        super()._free()  # type: ignore
+
+
+class TickScheduler:
+    budget: ClassVar[int] = 32  # Minimum ticks per frame, of `TickTier.BUDGETED`
+    max_period: ClassVar[int] = 16  # Most frames between ticks, of `TickTier.BUDGETED`
+    # NOTE: Budget is counted in ticks, not time, so replays stay deterministic
+    _every_frame: ClassVar[dict[int, Ticked]] = {}
+    # Buckets of each interval, where bucket `frame % interval` is due
+    _buckets: ClassVar[dict[int, list[dict[int, Ticked]]]] = {}
+    _bucket_of: ClassVar[dict[int, dict[int, Ticked]]] = {}  # By uid
+    _budgeted: ClassVar[dict[int, Ticked]] = {}
+    _budget_queue: ClassVar[deque[Ticked]] = deque()  # Freed nodes are skipped
+
+    @classmethod
+    def add(cls, node: Ticked) -> None:
+        uid = node.uid  # type: ignore
+        match node.TICK_TIER:
+            case TickTier.FRAME:
+                cls._every_frame[uid] = node
+            case TickTier.INTERVAL:
+                assert node.TICK_INTERVAL >= 1, f"Invalid interval of {node}"
+                buckets = cls._buckets.setdefault(
+                    node.TICK_INTERVAL,
+                    [{} for _ in range(node.TICK_INTERVAL)],
+                )
+                bucket = min(buckets, key=len)  # Spread evenly
+                bucket[uid] = node
+                cls._bucket_of[uid] = bucket
+            case TickTier.BUDGETED:
+                cls._budgeted[uid] = node
+                cls._budget_queue.append(node)
+
+    @classmethod
+    def remove(cls, node: Ticked) -> None:
+        uid = node.uid  # type: ignore
+        cls._every_frame.pop(uid, None)
+        cls._budgeted.pop(uid, None)
+        bucket = cls._bucket_of.pop(uid, None)
+        if bucket is not None:
+            del bucket[uid]
+
+    @classmethod
+    def due(cls) -> list[Ticked]:
+        # Nodes to tick this frame, in order of tier
+        frame = GameTime.frame
+        nodes = list(cls._every_frame.values())
+        for interval, buckets in cls._buckets.items():
+            nodes.extend(buckets[frame % interval].values())
+        ticked = 0
+        budget = max(cls.budget, ceil(len(cls._budgeted) / cls.max_period))
+        queue = cls._budget_queue
+        for _ in range(len(queue)):
+            if ticked == budget:
+                break
+            node = queue.popleft()
+            if node.uid not in cls._budgeted:  # type: ignore
+                continue  # Freed
+            queue.append(node)
+            nodes.append(node)
+            ticked += 1
+        return nodes
+
+    @classmethod
+    def tick(cls, node: Ticked) -> None:
+        elapsed = GameTime.frame - node._last_tick_frame
+        if elapsed <= 0:  # Created this frame
+            return
+        node._last_tick_frame = GameTime.frame
+        node.tick(elapsed)
+
+    @classmethod
+    def update_nodes(cls, delta: float) -> None:  # Call from `App.tick`
+        # Same as updating every node, but ticked nodes only when due
+        for node in list(Node.node_instances.values()):
+            if not isinstance(node, Ticked):
+                node.update(delta)
+        for node in cls.due():
+            cls.tick(node)
@@ -0,0 +1,228 @@
+"""Cached global transforms and visibility, for nodes in hierarchies.
+
+`charz` computes `global_position`, `global_rotation` and `is_globally_visible()`
+by walking the parent chain on every access. Nodes with the `CachedTransform`
+component instead keep the result, until the node or one of its ancestors
+changes `position`, `rotation`, `top_level`, `visible` or `parent`.
+A change marks the node and its descendants as outdated, where descendants
+of an outdated node are always outdated, so it stops at those already marked.
+
+Only nodes whose ancestors all use `CachedTransform` keep their result,
+as changes of other ancestors can't be seen. Other nodes compute it every time,
+like before, so mixing in `CachedTransform` never gives a wrong result.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Self
+
+from charz import Node, Transform, Texture, Vec2
+
+
+_WATCHED: tuple[str, ...] = ("position", "rotation", "top_level", "visible", "parent")
+
+
+class _TrackedVec2(Vec2):
+    # Position of `CachedTransform`, which is marked outdated when changed in place
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: CachedTransform, x: float, y: float, /) -> None:
+        object.__setattr__(self, "_owner", owner)
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, name) == value:
+            return
+        object.__setattr__(self, name, value)
+        self._owner._invalidate_transform()
+
+    def __str__(self) -> str:
+        return f"Vec2({self.x}, {self.y})"
+
+    # NOTE: Copies are plain `Vec2`, so they don't mark the owner when changed
+    def __copy__(self) -> Vec2:  # type: ignore[override]
+        return Vec2(self.x, self.y)
+
+    def __deepcopy__(self, _memo: Any) -> Vec2:  # type: ignore[override]
+        return Vec2(self.x, self.y)
+
+    def __reduce__(self) -> tuple[type[Vec2], tuple[float, float]]:
+        return (Vec2, (self.x, self.y))
+
+    def __abs__(self) -> Vec2:  # type: ignore[override]
+        return Vec2(abs(self.x), abs(self.y))
+
+    def __round__(self, ndigits: int = 0) -> Vec2:  # type: ignore[override]
+        return Vec2(round(self.x, ndigits), round(self.y, ndigits))
+
+
+class CachedTransform:  # Component (mixin class)
+    # Defaults of watched attributes, moved here from class bodies
+    _position: Vec2 | None = None
+    _rotation: float = 0
+    _top_level: bool = False
+    _visible: bool = True
+    _parent: Node | None = None
+    # Cache, where `None` means outdated
+    _global_position: Vec2 | None = None
+    _global_rotation: float | None = None
+    _global_visibility: bool | None = None
+    _cached_children: dict[int, CachedTransform]  # Set in `__new__`, by uid
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Class attributes like `visible = False` would hide the properties below
+        for name in _WATCHED:
+            if name in cls.__dict__ and not isinstance(cls.__dict__[name], property):
+                setattr(cls, f"_{name}", cls.__dict__[name])
+                delattr(cls, name)
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        instance = super().__new__(cls, *args, **kwargs)
+        assert isinstance(instance, Transform), f"`Transform` missing for {instance}"
+        instance._cached_children = {}
+        return instance
+
+    @property
+    def position(self) -> Vec2:
+        return self._position  # type: ignore[return-value]
+
+    @position.setter
+    def position(self, position: Vec2) -> None:
+        if position is not self._position:
+            self._position = _TrackedVec2(self, position.x, position.y)
+        self._invalidate_transform()
+
+    @property
+    def rotation(self) -> float:
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, rotation: float) -> None:
+        if rotation != self._rotation:
+            self._rotation = rotation
+            self._invalidate_transform()
+
+    @property
+    def top_level(self) -> bool:
+        return self._top_level
+
+    @top_level.setter
+    def top_level(self, state: bool) -> None:
+        if state != self._top_level:
+            self._top_level = state
+            self._invalidate_transform()
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, state: bool) -> None:
+        if state != self._visible:
+            self._visible = state
+            self._invalidate_visibility()
+
+    @property
+    def parent(self) -> Node | None:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Node | None) -> None:
+        if parent is self._parent:
+            return
+        uid: int = self.uid  # type: ignore
+        if isinstance(self._parent, CachedTransform):
+            del self._parent._cached_children[uid]
+        self._parent = parent
+        if isinstance(parent, CachedTransform):
+            parent._cached_children[uid] = self
+        self._invalidate_transform()
+        self._invalidate_visibility()
+
+    def _invalidate_transform(self) -> None:
+        if self._global_position is None:  # Descendants are outdated as well
+            return
+        self._global_position = None
+        self._global_rotation = None
+        for child in self._cached_children.values():
+            child._invalidate_transform()
+
+    def _invalidate_visibility(self) -> None:
+        if self._global_visibility is None:
+            return
+        self._global_visibility = None
+        for child in self._cached_children.values():
+            child._invalidate_visibility()
+
+    def _global_transform(self) -> tuple[Vec2, float]:
+        # Cached result, or computed from parent, and cached if parent's is cached
+        if self._global_position is not None:
+            assert self._global_rotation is not None
+            return (self._global_position, self._global_rotation)
+        position = self._position
+        assert position is not None
+        parent = self._parent
+        if self._top_level or not isinstance(parent, Transform):
+            is_cacheable = True
+            global_position = Vec2(position.x, position.y)
+            global_rotation = self._rotation
+        else:
+            if isinstance(parent, CachedTransform):
+                (parent_position, parent_rotation) = parent._global_transform()
+                is_cacheable = parent._global_position is not None
+            else:
+                parent_position = parent.global_position
+                parent_rotation = parent.global_rotation
+                is_cacheable = False
+            # Check for rotation, since cos(0) and sin(0) produces *approximate* values
+            if parent_rotation:
+                global_position = parent_position + position.rotated(parent_rotation)
+            else:
+                global_position = parent_position + position
+            global_rotation = parent_rotation + self._rotation
+        if is_cacheable:
+            self._global_position = global_position
+            self._global_rotation = global_rotation
+        return (global_position, global_rotation)
+
+    @property
+    def global_position(self) -> Vec2:
+        return self._global_transform()[0].copy()
+
+    @global_position.setter
+    def global_position(self, position: Vec2) -> None:
+        diff = position - self.global_position
+        self.position += diff
+
+    @property
+    def global_rotation(self) -> float:
+        return self._global_transform()[1]
+
+    @global_rotation.setter
+    def global_rotation(self, rotation: float) -> None:
+        diff = rotation - self.global_rotation
+        self.rotation += diff
+
+    def is_globally_visible(self) -> bool:
+        if self._global_visibility is not None:
+            return self._global_visibility
+        parent = self._parent
+        if not self._visible or not isinstance(parent, Texture):
+            is_cacheable = True
+            visibility = self._visible
+        elif isinstance(parent, CachedTransform):
+            visibility = parent.is_globally_visible()
+            is_cacheable = parent._global_visibility is not None
+        else:
+            visibility = parent.is_globally_visible()
+            is_cacheable = False
+        if is_cacheable:
+            self._global_visibility = visibility
+        return visibility
+
+    def _free(self) -> None:
+        if isinstance(self._parent, CachedTransform):
+            self._parent._cached_children.pop(self.uid, None)  # type: ignore
+        super()._free()  # type: ignore
@@ -1,28 +1,31 @@
 from __future__ import annotations
 
 from math import ceil
-from typing import MutableMapping
+from collections.abc import Callable, Hashable
 
-import pygame
 import colex
 from colex import ColorValue
 from charz import Node, Sprite, Label, Vec2, text, clamp
 
-from .item import ItemID, Recipe
+from . import audio, inventory
+from .item import Recipe
+from .profiler import FrameProfiler, sparkline
+from .gametime import GameTime, ScheduledEvent
+from .transforms import CachedTransform
 
 
 type Count = int
 type Craftable = bool
+type CraftableCount = int  # Including crafting missing intermediates
 type IdgredientCount = int
 
 
 _UI_LEFT_OFFSET: int = -50
 _UI_RIGHT_OFFSET: int = 40
-_UI_CHANNEL = pygame.mixer.Channel(0)
 
 
 # TODO: Render `UIElement` on top of screen buffer (Would be nice with `FrameTask`)
-class UIElement:  # NOTE: Have this be the first mixin in mro
+class UIElement(CachedTransform):  # NOTE: Have this be the first mixin in mro
     z_index = 5  # Global UI z-index
 
 
@@ -34,32 +37,23 @@ class Inventory(UIElement, Sprite):
     def __init__(
         self,
         parent: Node,
-        inventory_ref: MutableMapping[ItemID, Count],
+        inventory_ref: inventory.Inventory,
     ) -> None:
         super().__init__(parent=parent)
         self._inventory_ref = inventory_ref
         self._update_texture()
 
     def update(self, _delta: float) -> None:
-        # Remove items that has a count of 0
-        for item, count in tuple(self._inventory_ref.items()):
-            if count == 0:
-                del self._inventory_ref[item]
-            elif count < 0:
-                raise ValueError(f"Item {repr(item)} has negative count: {count}")
-        # Update every frame because inventory items might be mutated
-        self._update_texture()
+        # Only re-render when contents changed
+        if self._inventory_ref.version != self._version:
+            self._update_texture()
 
     def _update_texture(self) -> None:
-        # Sort by items count
-        name_sorted = sorted(
-            self._inventory_ref.items(),
-            key=lambda pair: pair[0].name,
-        )
+        self._version = self._inventory_ref.version
+        # Sort by items count, then by name
         count_sorted = sorted(
-            name_sorted,
-            key=lambda pair: pair[1],
-            reverse=True,
+            self._inventory_ref.items(),
+            key=lambda pair: (-pair[1], pair[0].name),
         )
         self.texture = text.fill_lines(
             [
@@ -100,86 +94,147 @@ class Hotbar3(UIElement, Label):
 
 # TODO: Move sounds to `InfoBar` (and subclasses) using hooks
 class InfoBar(UIElement, Label):
+    """Bar of a value, that changes by a rate per frame
+
+    The value is stored as where it was at an anchor frame, and calculated from
+    the rate when read. The bar is only rendered when its cell count changes,
+    at frames scheduled ahead with `GameTime`, so a steady rate costs nothing
+    on other frames.
+    """
+
     MAX_VALUE: float = 100
     MAX_CELL_COUNT: int = 10
     _LABEL: str = "<Unset>"
     _CELL_CHAR: str = "#"
     _CELL_FILL: str = " "
     color = colex.ITALIC + colex.WHITE
-    _value: float = 0
+    _anchor_value: float = 0
+    _anchor_frame: int = 0
+    _rate: float = 0  # Change per frame
+    # As last rendered
+    _shown_value: float = 0
+    _shown_cell_count: int = 0
+    _cell_event: ScheduledEvent | None = None
 
     def __init__(self, parent: Node) -> None:
         super().__init__(parent=parent)
+        self._listeners: list[Callable[[float, int], None]] = []
         self.value = self.MAX_VALUE
 
     @property
     def value(self) -> float:
-        return self._value
+        return self.value_at(GameTime.frame)
 
     @value.setter
     def value(self, value: float) -> None:
-        last_value = self.value
-        last_cell_count = self.cell_count
+        self._anchor_value = clamp(value, 0, self.MAX_VALUE)
+        self._anchor_frame = GameTime.frame
+        self._update_cells()
 
-        self._value = clamp(value, 0, self.MAX_VALUE)
-        percent = self._value / self.MAX_VALUE
+    @property
+    def rate(self) -> float:
+        return self._rate
 
-        cell_count = ceil(self.MAX_CELL_COUNT * percent)
-        cells = self._CELL_CHAR * cell_count
-        progress = cells.ljust(self.MAX_CELL_COUNT, self._CELL_FILL)
-        self.text = f"[{progress}]> {self._LABEL}"
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        # Changes by new rate every frame after this one
+        self._anchor_value = self.value
+        self._anchor_frame = GameTime.frame
+        self._rate = rate
+        self._update_cells()
 
-        change = self.value - last_value
-        cells_changed = cell_count - last_cell_count
-        self.on_change(change, cells_changed)
+    def value_at(self, frame: int) -> float:
+        value = self._anchor_value + self._rate * (frame - self._anchor_frame)
+        return clamp(value, 0, self.MAX_VALUE)
 
     @property
     def cell_count(self) -> int:
-        percent = self.value / self.MAX_VALUE
+        return self._cell_count_of(self.value)
+
+    def _cell_count_of(self, value: float) -> int:
+        percent = value / self.MAX_VALUE
         return ceil(self.MAX_CELL_COUNT * percent)
 
     def fill(self) -> None:
-        last_value = self.value
-        last_cell_count = self.cell_count
         self.value = self.MAX_VALUE
-        change = self.value - last_value
-        cells_changed = self.cell_count - last_cell_count
-        self.on_change(change, cells_changed)
+
+    def subscribe(self, listener: Callable[[float, int], None]) -> None:
+        # Called after `on_change`, with the same arguments
+        self._listeners.append(listener)
 
     def on_change(self, change: float, cells_changed: int, /) -> None: ...
 
+    def _update_cells(self) -> None:
+        # Render, and schedule next frame that cell count changes
+        if self._cell_event is not None:
+            self._cell_event.cancel()
+            self._cell_event = None
+        value = self.value
+        cell_count = self._cell_count_of(value)
+        cells = self._CELL_CHAR * cell_count
+        progress = cells.ljust(self.MAX_CELL_COUNT, self._CELL_FILL)
+        self.text = f"[{progress}]> {self._LABEL}"
+
+        change = value - self._shown_value
+        cells_changed = cell_count - self._shown_cell_count
+        self._shown_value = value
+        self._shown_cell_count = cell_count
+        self.on_change(change, cells_changed)
+        for listener in self._listeners:
+            listener(change, cells_changed)
+
+        next_frame = self._next_cell_frame(cell_count)
+        if next_frame is not None:
+            self._cell_event = GameTime.schedule(next_frame, self._update_cells)
+
+    def _next_cell_frame(self, cell_count: int) -> int | None:
+        if self._rate < 0 and cell_count > 0:
+            boundary = self.MAX_VALUE * (cell_count - 1) / self.MAX_CELL_COUNT
+        elif self._rate > 0 and cell_count < self.MAX_CELL_COUNT:
+            boundary = self.MAX_VALUE * cell_count / self.MAX_CELL_COUNT
+        else:  # Stays the same
+            return None
+        frames = ceil((boundary - self._anchor_value) / self._rate)
+        frame = max(self._anchor_frame + frames, GameTime.frame + 1)
+        # Correct for rounding, since cell count is what decides
+        while (
+            frame - 1 > GameTime.frame
+            and self._cell_count_of(self.value_at(frame - 1)) != cell_count
+        ):
+            frame -= 1
+        while self._cell_count_of(self.value_at(frame)) == cell_count:
+            frame += 1
+        return frame
+
 
 class HealthBar(InfoBar):
     MAX_VALUE = 100
-    _SOUND_HEAL = pygame.mixer.Sound("assets/sounds/ui/health/heal.wav")
-    _SOUND_HURT = pygame.mixer.Sound("assets/sounds/ui/health/hurt.wav")
-    _CHANNEL_HURT = pygame.mixer.Channel(1)
+    _SOUND_HEAL = audio.load("assets/sounds/ui/health/heal.wav")
+    _SOUND_HURT = audio.load("assets/sounds/ui/health/hurt.wav")
     _LABEL = "Health"
     position = Vec2(_UI_LEFT_OFFSET, -5)
     color = colex.PALE_VIOLET_RED
 
     def on_change(self, change: float, _cells_changed: int) -> None:
         if change > 0:
-            _UI_CHANNEL.play(self._SOUND_HEAL)
-        elif change < 0 and not self._CHANNEL_HURT.get_busy():
-            self._CHANNEL_HURT.play(self._SOUND_HURT)
+            self._SOUND_HEAL.play(priority=audio.Priority.UI)
+        elif change < 0:
+            self._SOUND_HURT.play(priority=audio.Priority.UI, exclusive=True)
 
 
 class OxygenBar(InfoBar):
     MAX_VALUE = 30
-    _SOUND_BREATHE = pygame.mixer.Sound("assets/sounds/ui/oxygen/breathe.wav")
-    _SOUND_BUBBLE = pygame.mixer.Sound("assets/sounds/ui/oxygen/bubble.wav")
-    _CHANNEL_BREATH = pygame.mixer.Channel(2)
-    _CHANNEL_BUBBLE = pygame.mixer.Channel(3)
+    _SOUND_BREATHE = audio.load("assets/sounds/ui/oxygen/breathe.wav")
+    _SOUND_BUBBLE = audio.load("assets/sounds/ui/oxygen/bubble.wav")
     _LABEL = "O2"
     position = Vec2(_UI_LEFT_OFFSET, -4)
     color = colex.AQUAMARINE
 
     def on_change(self, change: float, cells_changed: int) -> None:
-        if change > 0 and not self._CHANNEL_BREATH.get_busy():
-            self._CHANNEL_BREATH.play(self._SOUND_BREATHE)
-        if cells_changed and not self._CHANNEL_BUBBLE.get_busy():
-            self._CHANNEL_BUBBLE.play(self._SOUND_BUBBLE)
+        if change > 0:
+            self._SOUND_BREATHE.play(priority=audio.Priority.UI, exclusive=True)
+        if cells_changed:
+            self._SOUND_BUBBLE.play(priority=audio.Priority.UI, exclusive=True)
 
 
 class HungerBar(InfoBar):
@@ -232,6 +287,9 @@ class Panel(Sprite):
         ]
 
 
+class _Row(CachedTransform, Label): ...
+
+
 class Crafting(UIElement, Panel):  # GUI
     _DEFAULT_PRODUCT_COLOR: ColorValue = colex.GRAY
     _CRAFTABLE_PRODUCT_COLOR: ColorValue = colex.GOLDENROD
@@ -254,29 +312,29 @@ class Crafting(UIElement, Panel):  # GUI
         super().__init__(parent=parent)
         self.width = 50
         self.height = 8
-        self._info_labels: list[Label] = []
+        # Rows are reused, and hidden when not needed
+        self._rows: list[_Row] = []
+        self._row_states: list[tuple[str, ColorValue]] = []
+        self._used_row_count = 0
+        self.shown_state: Hashable | None = None  # Set by caller, to skip updates
 
     # I did not want to pass inventory of the one interacting with the `Fabrication`,
     # therefore, states regarding craftable and count of idgredients are passed
-    # using a tuple of 3 elements
+    # using tuples
     def update_from_recipe(
         self,
         current_recipe: Recipe,
         selected_idgredient_counts: tuple[IdgredientCount, ...],
-        all_recipe_states: list[tuple[Recipe, Craftable]],
+        all_recipe_states: list[tuple[Recipe, Craftable, CraftableCount]],
     ) -> None:
-        self.height = len(all_recipe_states) + len(current_recipe.idgredients) + 2
-
-        for products_label in self._info_labels:
-            products_label.queue_free()
-        self._info_labels.clear()
-
-        lino = 1  # Manual lino, because current recipe needs more place
-        for recipe, craftable in all_recipe_states:
+        row_states: list[tuple[str, ColorValue]] = []
+        for recipe, craftable, craftable_count in all_recipe_states:
             products_text = " + ".join(
                 f"{product_count}x{product.name.replace("_", " ").capitalize()}"
                 for product, product_count in recipe.products.items()
             )
+            if craftable_count:
+                products_text += f" [C: {craftable_count}]"
             products_color = (  # This might not be the prettiest, but should be ok
                 (
                     self._SELECTED_CRAFTABLE_PRODUCT_COLOR
@@ -290,18 +348,7 @@ class Crafting(UIElement, Panel):  # GUI
                     else self._DEFAULT_PRODUCT_COLOR
                 )
             )
-            products_label = Label(
-                self,
-                text=products_text,
-                z_index=self.z_index + 1,
-                color=products_color,
-                position=Vec2(
-                    -self.texture_size.x // 2,
-                    -self.texture_size.y // 2 + lino,
-                ),
-            )
-            lino += 1
-            self._info_labels.append(products_label)
+            row_states.append((products_text, products_color))
 
             if recipe is current_recipe:
                 for index, (idgredient, idgredient_cost) in enumerate(
@@ -317,15 +364,62 @@ class Crafting(UIElement, Panel):  # GUI
                         if idgredient_count >= idgredient_cost
                         else self._MISSING_IDGREDIENT_COLOR
                     )
-                    idgredient_label = Label(
-                        self,
-                        text="- " + idgredient_text,
-                        z_index=self.z_index + 1,
-                        color=idgredient_color,
-                        position=Vec2(
-                            -self.texture_size.x // 2,
-                            -self.texture_size.y // 2 + lino,
-                        ),
-                    )
-                    self._info_labels.append(idgredient_label)
-                    lino += 1
+                    row_states.append(("- " + idgredient_text, idgredient_color))
+        self._set_rows(row_states)
+
+    def _set_rows(self, row_states: list[tuple[str, ColorValue]]) -> None:
+        # Only touch rows whose text or color changed
+        height = len(row_states) + 2
+        if height != self.height:
+            self.height = height
+            for lino, row in enumerate(self._rows, start=1):
+                row.position = self._row_position(lino)
+        while len(self._rows) < len(row_states):
+            lino = len(self._rows) + 1
+            self._rows.append(
+                _Row(
+                    self,
+                    z_index=self.z_index + 1,
+                    position=self._row_position(lino),
+                )
+            )
+            self._row_states.append(("", None))
+        for index, row_state in enumerate(row_states):
+            if self._row_states[index] != row_state:
+                row = self._rows[index]
+                (row.text, row.color) = row_state
+                self._row_states[index] = row_state
+        for index in range(len(row_states), self._used_row_count):
+            self._rows[index].visible = False
+        for index in range(self._used_row_count, len(row_states)):
+            self._rows[index].visible = True
+        self._used_row_count = len(row_states)
+
+    def _row_position(self, lino: int) -> Vec2:
+        return Vec2(
+            -self.texture_size.x // 2,
+            -self.texture_size.y // 2 + lino,
+        )
+
+
+class FrameStats(UIElement, Label):
+    position = Vec2(_UI_LEFT_OFFSET, -12)
+    color = colex.LIGHT_GRAY
+    visible = False
+
+    def update(self, _delta: float) -> None:
+        self.visible = FrameProfiler.is_enabled
+        if not self.visible:
+            return
+        milliseconds = 1000
+        self.text = "\n".join(
+            (
+                f"Frame  {FrameProfiler.frame_time * milliseconds:6.1f} ms",
+                f"Update {FrameProfiler.update_time * milliseconds:6.1f} ms",
+                f"Render {FrameProfiler.render_time * milliseconds:6.1f} ms",
+                f"Write  {FrameProfiler.write_time * milliseconds:6.1f} ms",
+                f"Output {FrameProfiler.output_bytes / 1024:6.1f} KiB",
+                f"Nodes  {FrameProfiler.node_count:6}",
+                sparkline(list(FrameProfiler.frame_times)),
+            )
+        )
@@ -3,10 +3,16 @@ from collections.abc import Iterable, Generator
 from collections import deque
 from typing import Callable
 
+from charz import text
+
 
 type FloatToInt = Callable[[float], int]
 
 
+# Texture and its mirror, by id of texture - Both are kept alive, so ids are not reused
+_flip_h_cache: dict[int, tuple[list[str], list[str]]] = {}
+
+
 def groupwise[T](iterable: Iterable[T], /, n: int) -> Generator[tuple[T, ...]]:
     accum = deque((), n)
     for element in iterable:
@@ -23,3 +29,27 @@ def move_toward(start: float, target: float, change: float) -> float:
     if abs(target - start) <= change:
         return target
     return start + change if start < target else start - change
+
+
+def flipped_h(texture: list[str], /) -> list[str]:
+    """Mirror texture horizontally, reusing the result for the same texture object
+
+    Flipping the result gives back the original object,
+    so changing direction is just swapping between two lists.
+
+    `NOTE`: Only use with long lived textures, like class textures and animation frames,
+    since every texture passed is kept in the cache.
+
+    Args:
+        texture (list[str]): texture to mirror
+
+    Returns:
+        list[str]: shared mirrored texture, do not mutate
+    """
+    entry = _flip_h_cache.get(id(texture))
+    if entry is not None and entry[0] is texture:
+        return entry[1]
+    flipped = text.flip_lines_h(texture)
+    _flip_h_cache[id(texture)] = (texture, flipped)
+    _flip_h_cache[id(flipped)] = (flipped, texture)
+    return flipped
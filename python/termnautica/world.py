@@ -0,0 +1,226 @@
+"""Worlds, so one process can host many independent sessions.
+
+Game state lives in class attributes, like `Floor.points`, `GameTime.frame`
+and `Node.node_instances`, which every node reads directly. Instead of threading
+a world through all of those, a `World` owns its own value of each of them,
+and swaps them in while active:
+
+    with World(seed=1):
+        app = HeadlessApp()
+        for _ in range(100):
+            app.tick()
+
+Leaving the world swaps back what was active before, so worlds can be stepped
+in turn, one frame each. `run_sessions` spreads `Session`s over processes.
+
+`NOTE`: Only one world is active at a time per process, so don't step worlds
+from several threads. Configuration (`ocean.WIDTH`), caches (assets, recipes)
+and diagnostics (`CostAccounting`, `FrameProfiler`) are shared by every world.
+"""
+
+import random
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Self
+
+from charz import Node, Texture, Collider, Camera
+
+from . import controls
+from .controls import Mask
+from .gametime import GameTime
+from .ticks import TickScheduler
+from .ocean import Floor, Water
+from .collision import BitGrid, BroadphaseCollider
+from .spatial import SpatialHash
+from .props import Interactable
+from .registry import Registered
+from .animation import ClockAnimated
+from .pursuit import FlowField
+from .fish import SwordFish
+from .replay import state_checksum
+
+
+type RandomState = tuple[Any, ...]
+
+
+_MISSING = object()  # Attribute not set, like `Camera._current` before first use
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class _Slot:
+    owner: object  # Class or module
+    name: str
+    factory: Callable[[], Any]  # Value of new world
+
+
+def _nothing_pressed() -> Mask:
+    return 0
+
+
+def _like[T: SpatialHash[Any]](spatial_hash: T) -> Callable[[], T]:
+    return lambda: type(spatial_hash)(cell_size=spatial_hash.cell_size)
+
+
+_SLOTS: tuple[_Slot, ...] = (
+    # `charz`
+    _Slot(owner=Node, name="node_instances", factory=dict),
+    _Slot(owner=Node, name="_queued_nodes", factory=list),
+    _Slot(owner=Node, name="_uid_counter", factory=lambda: count(0, 1)),
+    _Slot(owner=Texture, name="texture_instances", factory=dict),
+    _Slot(owner=Collider, name="collider_instances", factory=dict),
+    _Slot(owner=Camera, name="_current", factory=lambda: _MISSING),
+    # Game
+    _Slot(owner=GameTime, name="frame", factory=int),
+    _Slot(owner=GameTime, name="_events", factory=list),
+    _Slot(owner=GameTime, name="_event_count", factory=int),
+    _Slot(owner=controls, name="_source", factory=lambda: _nothing_pressed),
+    _Slot(
+        owner=controls,
+        name="_snapshot",
+        factory=lambda: controls.Snapshot(frame=0, mask=0),
+    ),
+    _Slot(owner=TickScheduler, name="_every_frame", factory=dict),
+    _Slot(owner=TickScheduler, name="_buckets", factory=dict),
+    _Slot(owner=TickScheduler, name="_bucket_of", factory=dict),
+    _Slot(owner=TickScheduler, name="_budgeted", factory=dict),
+    _Slot(owner=TickScheduler, name="_budget_queue", factory=deque),
+    _Slot(owner=Floor, name="points", factory=set),
+    _Slot(owner=Floor, name="grid", factory=BitGrid),
+    _Slot(owner=Floor, name="surface", factory=dict),
+    _Slot(owner=Floor, name="abyss_points", factory=set),
+    _Slot(owner=Water, name="_wave_time_remaining", factory=float),
+    _Slot(
+        owner=BroadphaseCollider,
+        name="broadphase",
+        factory=_like(BroadphaseCollider.broadphase),
+    ),
+    _Slot(
+        owner=Interactable,
+        name="spatial_hash",
+        factory=_like(Interactable.spatial_hash),
+    ),
+    _Slot(owner=Interactable, name="max_reach_extent", factory=float),
+    _Slot(
+        owner=ClockAnimated,
+        name="visibility",
+        factory=_like(ClockAnimated.visibility),
+    ),
+    _Slot(
+        owner=Registered,
+        name="_registries",
+        factory=lambda: type(Registered._registries)(dict),
+    ),
+    _Slot(
+        owner=SwordFish,
+        name="_PURSUIT_FIELD",
+        factory=lambda: FlowField(
+            radius=SwordFish._PURSUIT_FIELD.radius,
+            refresh_interval=SwordFish._PURSUIT_FIELD.refresh_interval,
+        ),
+    ),
+)
+
+
+def _read_slots() -> list[Any]:
+    return [vars(slot.owner).get(slot.name, _MISSING) for slot in _SLOTS]
+
+
+def _write_slots(values: list[Any]) -> None:
+    for slot, value in zip(_SLOTS, values):
+        if value is not _MISSING:
+            setattr(slot.owner, slot.name, value)
+        elif slot.name in vars(slot.owner):
+            delattr(slot.owner, slot.name)
+
+
+class World:
+    def __init__(self, seed: int | None = None) -> None:
+        """Create empty world, which is filled by creating `App` while active
+
+        Args:
+            seed (int | None, optional): seed of `random`, while active.
+                Defaults to None, which seeds from system.
+        """
+        self._values = [slot.factory() for slot in _SLOTS]
+        self._random_state: RandomState = random.Random(seed).getstate()
+        # What was active before entering, restored when leaving
+        self._outer: tuple[list[Any], RandomState] | None = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._outer is not None
+
+    def __enter__(self) -> Self:
+        if self._outer is not None:
+            raise RuntimeError(f"{self} is already active")
+        self._outer = (_read_slots(), random.getstate())
+        _write_slots(self._values)
+        random.setstate(self._random_state)
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        assert self._outer is not None, f"{self} is not active"
+        self._values = _read_slots()
+        self._random_state = random.getstate()
+        (values, random_state) = self._outer
+        self._outer = None
+        _write_slots(values)
+        random.setstate(random_state)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Session:
+    seed: int
+    ticks: int
+    masks: tuple[Mask, ...] = ()  # Key mask of each frame, nothing pressed after
+
+
+def simulate(session: Session) -> int:
+    """Run session headless, in a world of its own
+
+    Args:
+        session (Session): seed, length and input of session
+
+    Returns:
+        int: checksum of final state, see `replay.state_checksum`
+    """
+    from .app import SessionApp
+
+    with World(seed=session.seed):
+        masks = iter(session.masks)
+        controls.set_source(lambda: next(masks, 0))
+        app = SessionApp()
+        app.is_running = True  # Cleared when "esc" is pressed
+        for _ in range(session.ticks):
+            app.tick()
+            if not app.is_running:
+                break
+        return state_checksum(app)
+
+
+def run_sessions(
+    sessions: Iterable[Session],
+    max_workers: int | None = None,
+) -> list[int]:
+    """Simulate sessions in parallel, each in a world of its own
+
+    Args:
+        sessions (Iterable[Session]): sessions to run
+        max_workers (int | None, optional): worker processes.
+            Defaults to None, which is one per core.
+
+    Returns:
+        list[int]: checksum of each session, in order
+    """
+    sessions = list(sessions)
+    if max_workers == 1:
+        return list(map(simulate, sessions))
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(simulate, sessions))
+    except (OSError, BrokenProcessPool):  # Processes could not start, so do it here
+        return list(map(simulate, sessions))
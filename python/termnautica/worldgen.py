@@ -0,0 +1,189 @@
+"""Ocean floor generation as plain data, split into independent segments.
+
+Each segment covers up to `SEGMENT_WIDTH` columns, and draws from its own
+`random.Random`, seeded from the world seed and the segment index.
+Since segments don't depend on each other, wide worlds are generated
+in a process pool, and `ocean.generate_floor` merges the results into nodes
+on the main thread.
+
+Depth within a segment is relative to where the segment starts,
+and every random choice the merge needs is rolled here, for every point,
+so building nodes only follows the rolls.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import ClassVar
+
+
+type Coordinate = tuple[int, int]
+type Bounds = tuple[int, int]  # Start and end X-position, end excluded
+
+
+SEGMENT_WIDTH: int = 1024
+NO_SPAWNER: int = -1
+
+
+class Abyss:
+    SPAWN_CHANCE: ClassVar[int] = 200  # 1 out of X chance
+    MIN_WIDTH: ClassVar[int] = 10
+    MAX_WIDTH: ClassVar[int] = 20
+    MIN_DEPTH: ClassVar[int] = 20
+    MAX_DEPTH: ClassVar[int] = 60
+    CRYSTAL_CHANCE: ClassVar[int] = 30  # 1 out of X chance, per wall point
+    DIAMOND_CHANCE: ClassVar[int] = 8  # 1 out of X chance, per floor point
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class FloorPoint:
+    x: int
+    y: int  # Relative to start depth of segment
+    steep_glyph: str  # Used if terrain is steep here
+    has_diamond: bool  # Used if point is on abyss floor
+    spawner: int  # Index in spawner chances, or `NO_SPAWNER`
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Segment:
+    index: int
+    end_depth: float  # Relative depth after last column
+    points: list[FloorPoint]  # In texture order, including abyss walls
+    abyss_points: list[Coordinate]  # Points on abyss floor
+    crystal_points: list[Coordinate]  # Abyss wall points with a crystal
+
+
+def _roll_point(
+    rng: random.Random,
+    point: Coordinate,
+    spawner_chances: tuple[int, ...],
+) -> FloorPoint:
+    steep_glyph = "|"
+    if rng.randint(1, 3) == 1:
+        steep_glyph = "<" if rng.randint(1, 2) == 1 else ">"
+    has_diamond = rng.randint(1, Abyss.DIAMOND_CHANCE) == 1
+    spawner = NO_SPAWNER
+    # Order is randomized for each attempt
+    order = list(range(len(spawner_chances)))
+    rng.shuffle(order)
+    for index in order:
+        if rng.randint(1, 100) <= spawner_chances[index]:
+            spawner = index
+            break
+    return FloorPoint(
+        x=point[0],
+        y=point[1],
+        steep_glyph=steep_glyph,
+        has_diamond=has_diamond,
+        spawner=spawner,
+    )
+
+
+def generate_segment(
+    index: int,
+    bounds: Bounds,
+    seed: str,
+    spawner_chances: tuple[int, ...],
+) -> Segment:
+    """Generate floor of one segment
+
+    Args:
+        index (int): index of segment, from left
+        bounds (Bounds): X-positions covered
+        seed (str): seed for this segment, see `segment_seed`
+        spawner_chances (tuple[int, ...]): percent chance of each spawner kind
+
+    Returns:
+        Segment: generated floor, with depth relative to start of segment
+    """
+    rng = random.Random(seed)
+    (start, end) = bounds
+    depth = 0.0
+    points: list[FloorPoint] = []
+    abyss_points: list[Coordinate] = []
+    crystal_points: list[Coordinate] = []
+    abyss_length_left = 0
+    abyss_depth = 0
+
+    for x in range(start, end):
+        is_abyss_edge = False
+        # Check if starting to generate an abyss, that fits in this segment
+        if not abyss_length_left and rng.randint(1, Abyss.SPAWN_CHANCE) == 1:
+            abyss_depth = rng.randint(Abyss.MIN_DEPTH, Abyss.MAX_DEPTH)
+            length = rng.randint(Abyss.MIN_WIDTH, Abyss.MAX_WIDTH)
+            if x + length <= end:
+                abyss_length_left = length
+                is_abyss_edge = True
+
+        depth += rng.random() * 2 - 1
+        y = int(depth)
+        if abyss_length_left:
+            y += abyss_depth
+            abyss_points.append((x, y))
+            abyss_length_left -= 1
+            if abyss_length_left == 0:
+                is_abyss_edge = True
+        points.append(_roll_point(rng, (x, y), spawner_chances))
+
+        # Abyss walls, with crystals
+        if is_abyss_edge:
+            for offset in range(abyss_depth):
+                wall_point = (x + rng.randint(-1, 0), int(depth) + offset)
+                points.append(_roll_point(rng, wall_point, spawner_chances))
+                if rng.randint(1, Abyss.CRYSTAL_CHANCE) == 1:
+                    crystal_points.append(wall_point)
+
+    return Segment(
+        index=index,
+        end_depth=depth,
+        points=points,
+        abyss_points=abyss_points,
+        crystal_points=crystal_points,
+    )
+
+
+def segment_seed(world_seed: int, index: int) -> str:
+    # String seeds are hashed by `random`, so nearby indices give unrelated streams
+    return f"{world_seed}:{index}"
+
+
+def segment_bounds(width: int) -> list[Bounds]:
+    # Centered around X-position 0, like the rest of the world
+    left = -width // 2
+    right = width // 2
+    return [
+        (start, min(start + SEGMENT_WIDTH, right))
+        for start in range(left, right, SEGMENT_WIDTH)
+    ]
+
+
+def generate_segments(
+    world_seed: int,
+    width: int,
+    spawner_chances: tuple[int, ...],
+    max_workers: int | None = None,
+) -> list[Segment]:
+    """Generate every segment of the floor, in parallel if there is more than one
+
+    Args:
+        world_seed (int): seed that every segment seed is derived from
+        width (int): world width
+        spawner_chances (tuple[int, ...]): percent chance of each spawner kind
+        max_workers (int | None, optional): worker processes.
+            Defaults to None, which is one per core.
+
+    Returns:
+        list[Segment]: segments, from left
+    """
+    bounds = segment_bounds(width)
+    seeds = [segment_seed(world_seed, index) for index in range(len(bounds))]
+    indices = list(range(len(bounds)))
+    chances = [spawner_chances] * len(bounds)
+    if len(bounds) <= 1 or max_workers == 1:
+        return list(map(generate_segment, indices, bounds, seeds, chances))
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(generate_segment, indices, bounds, seeds, chances))
+    except (OSError, BrokenProcessPool):  # Processes could not start, so do it here
+        return list(map(generate_segment, indices, bounds, seeds, chances))
@@ -0,0 +1,78 @@
+import os
+import time
+import threading
+
+import pytest
+
+from termnautica import controls
+from termnautica.controls import KEYS, ARROW_UP, Snapshot, TerminalReader
+
+
+def held_keys(data: bytes) -> set[controls.Key]:
+    reader = TerminalReader(fileno=-1)  # Never started, only fed
+    reader.feed(data, time.monotonic())
+    snapshot = Snapshot(frame=0, mask=reader.poll())
+    return {key for key in KEYS if snapshot.is_pressed(key)}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"\x1b[C",  # Right arrow
+        b"\x1b[D",  # Left arrow
+        b"\x1bOC",  # Right arrow, application mode
+        b"\x1bOP",  # F1
+        b"\x1b[15~",  # F5
+        b"\x1b[1;5D",  # Ctrl + left arrow
+        b"\x1b[H",  # Home
+        b"\x1b[6~",  # Page down
+        b"\x1b[[A",  # F1, Linux console
+    ],
+)
+def test_unknown_sequence_is_dropped(data: bytes) -> None:
+    assert held_keys(data) == set()
+
+
+def test_known_sequences() -> None:
+    assert held_keys(b"\x1b[A") == {ARROW_UP}
+    assert held_keys(b"\x1bOR") == {"f3"}
+    assert held_keys(b"\x1b[Z") == {"shift", "tab"}
+
+
+def test_keys_around_sequences() -> None:
+    assert held_keys(b"a\x1b[Dd\x1bOPw") == {"a", "d", "w"}
+
+
+def test_lone_escape() -> None:
+    assert held_keys(b"\x1b") == {"esc"}
+    assert held_keys(b"a\x1b") == {"a", "esc"}
+
+
+def test_escape_followed_by_key_is_not_esc() -> None:
+    assert held_keys(b"\x1bc") == {"c"}
+
+
+def test_cut_off_sequence_is_dropped() -> None:
+    assert held_keys(b"\x1b[1;") == set()
+    assert held_keys(b"\x1bO") == set()
+
+
+def test_sequence_split_over_reads() -> None:
+    # Rest of sequence arrives after the escape was read, within the timeout
+    (read_fileno, write_fileno) = os.pipe()
+    reader = TerminalReader(read_fileno)
+    reader._is_running = True
+    thread = threading.Thread(target=reader._read_loop, daemon=True)
+    thread.start()
+    try:
+        os.write(write_fileno, b"\x1b")
+        time.sleep(TerminalReader._ESCAPE_TIMEOUT / 5)
+        os.write(write_fileno, b"[D")
+        time.sleep(0.2)
+        snapshot = Snapshot(frame=0, mask=reader.poll())
+        assert not snapshot.is_pressed("esc")
+    finally:
+        reader._is_running = False
+        os.close(write_fileno)
+        thread.join(timeout=1)
+        os.close(read_fileno)